@@ -1,11 +1,16 @@
 # app.py
 import streamlit as st
 import pandas as pd
-from src.services.bug_service import BugService
-from src.services.report_service import ReportService
-from src.services.analytics_service import AnalyticsService
-from src.database.db_manager import DatabaseManager
+import time
 from src.models.bug import Status, Severity, Priority
+from src.utils.streamlit_cache import (
+    get_analytics_service,
+    get_bug_service,
+    get_report_job_service,
+    load_bug_page,
+    load_bug_statistics
+)
+from src.services.report_job_service import JobStatus, REPORT_FORMATS
 
 def main():
     st.set_page_config(
@@ -15,10 +20,9 @@ def main():
     )
 
     # Initialize services
-    db_manager = DatabaseManager()
-    bug_service = BugService(db_manager)
-    report_service = ReportService()
-    analytics_service = AnalyticsService()
+    bug_service = get_bug_service()
+    report_jobs = get_report_job_service()
+    analytics_service = get_analytics_service()
 
     # Sidebar navigation
     page = st.sidebar.selectbox(
@@ -33,14 +37,13 @@ def main():
     elif page == "Bug List":
         show_bug_list(bug_service)
     else:
-        show_reports(bug_service, report_service)
+        show_reports(bug_service, report_jobs)
 
 def show_dashboard(bug_service, analytics_service):
     st.title("Bug Tracker Dashboard")
     
-    # Get all bugs and calculate statistics
-    all_bugs = bug_service.get_all_bugs()
-    stats = analytics_service.get_bug_statistics(all_bugs)
+    # Calculate statistics in the database
+    stats = load_bug_statistics()
     
     # Create three columns for metrics
     col1, col2, col3 = st.columns(3)
@@ -118,12 +121,39 @@ def show_create_bug(bug_service):
                 'actual_result': actual,
                 'created_by': "current_user"  # In a real app, get from auth
             }
-                
-            try:
-                bug = bug_service.create_bug(bug_data)
-                st.success(f"Bug created successfully! ID: {bug.id}")
-            except Exception as e:
-                st.error(f"Error creating bug: {str(e)}")
+
+            # Check before saving, so a duplicate can still be dropped
+            duplicates = bug_service.find_duplicates(bug_data)
+            if duplicates:
+                st.session_state.pending_bug = (bug_data, duplicates)
+            else:
+                st.session_state.pop('pending_bug', None)
+                save_new_bug(bug_service, bug_data)
+
+    if 'pending_bug' in st.session_state:
+        bug_data, duplicates = st.session_state.pending_bug
+        st.warning("This bug looks similar to existing reports:")
+        for duplicate, similarity in duplicates:
+            st.markdown(
+                f"- **{duplicate.title}** ({duplicate.id[:8]}, "
+                f"{duplicate.status.value}) - {similarity:.0%} similar"
+            )
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Create Anyway"):
+                del st.session_state.pending_bug
+                save_new_bug(bug_service, bug_data)
+        with col2:
+            if st.button("Discard"):
+                del st.session_state.pending_bug
+                st.experimental_rerun()
+
+def save_new_bug(bug_service, bug_data: dict):
+    try:
+        bug = bug_service.create_bug(bug_data)
+        st.success(f"Bug created successfully! ID: {bug.id}")
+    except Exception as e:
+        st.error(f"Error creating bug: {str(e)}")
 
 def show_bug_list(bug_service):
     st.title("Bug List")
@@ -146,11 +176,24 @@ def show_bug_list(bug_service):
             [p.value for p in Priority]
         )
     
-    # Get filtered bugs
-    bugs = bug_service.get_filtered_bugs(
-        status_filter,
-        severity_filter,
-        priority_filter
+    page_size = st.selectbox("Bugs per page", [25, 50, 100], index=1)
+    
+    # Restart from the first page whenever the filters change
+    filters = {
+        'status_filter': status_filter,
+        'severity_filter': severity_filter,
+        'priority_filter': priority_filter
+    }
+    if st.session_state.get('bug_list_filters') != filters:
+        st.session_state.bug_list_filters = filters
+        st.session_state.bug_list_cursors = [None]
+    cursors = st.session_state.bug_list_cursors
+    
+    # Get one page of filtered bugs
+    bugs, next_cursor = load_bug_page(
+        filters,
+        cursor=cursors[-1],
+        limit=page_size
     )
     
     # Display bugs in a table
@@ -167,13 +210,23 @@ def show_bug_list(bug_service):
         
         df = pd.DataFrame(bug_data)
         st.dataframe(df)
+        
+        col1, col2, col3 = st.columns([1, 1, 4])
+        with col1:
+            st.button("Previous page", on_click=cursors.pop,
+                      disabled=len(cursors) == 1)
+        with col2:
+            st.button("Next page", on_click=cursors.append, args=(next_cursor,),
+                      disabled=next_cursor is None)
+        with col3:
+            st.caption(f"Page {len(cursors)}")
     else:
         st.info("No bugs found matching the criteria.")
 
-def show_reports(bug_service, report_service):
+def show_reports(bug_service, report_jobs):
     st.title("Generate Reports")
     
-    report_type = st.radio("Report Format", ["Excel", "PDF"])
+    report_type = st.radio("Report Format", list(REPORT_FORMATS))
     
     # Add date range filter
     col1, col2 = st.columns(2)
@@ -183,35 +236,38 @@ def show_reports(bug_service, report_service):
         end_date = st.date_input("End Date")
     
     if st.button("Generate Report"):
-        bugs = bug_service.get_all_bugs()
+        filters = {'start_date': start_date, 'end_date': end_date}
         
-        # Filter bugs by date if specified
-        if start_date and end_date:
-            bugs = [bug for bug in bugs 
-                   if start_date <= bug.created_at.date() <= end_date]
-        
-        if not bugs:
+        if not bug_service.count_bugs(filters):
             st.warning("No bugs found in the selected date range.")
+            st.session_state.pop('report_job_id', None)
             return
             
-        try:
-            if report_type == "Excel":
-                filepath = report_service.generate_excel_report(bugs, "bug_report")
-                st.success(f"Excel report generated: {filepath}")
-            else:
-                filepath = report_service.generate_pdf_report(bugs, "bug_report")
-                st.success(f"PDF report generated: {filepath}")
-                
-            # Add download button
-            with open(filepath, 'rb') as file:
-                st.download_button(
-                    label="Download Report",
-                    data=file,
-                    file_name=f"bug_report.{'xlsx' if report_type == 'Excel' else 'pdf'}",
-                    mime="application/octet-stream"
-                )
-        except Exception as e:
-            st.error(f"Error generating report: {str(e)}")
+        st.session_state.report_job_id = report_jobs.submit(report_type, filters)
+    
+    job_id = st.session_state.get('report_job_id')
+    job = report_jobs.get_job(job_id) if job_id else None
+    if job is None:
+        return
+    if job.status == JobStatus.FAILED:
+        st.error(f"Error generating report: {job.error}")
+    elif job.status == JobStatus.DONE:
+        st.success(f"{job.report_format} report generated: {job.filepath}")
+        
+        # Add download button
+        with open(job.filepath, 'rb') as file:
+            st.download_button(
+                label="Download Report",
+                data=file,
+                file_name=f"bug_report.{REPORT_FORMATS[job.report_format]}",
+                mime="application/octet-stream"
+            )
+    else:
+        st.progress(job.progress,
+                    text=f"{job.status.value}: {job.rows_written} of {job.total_rows} bugs")
+        # Rerun while the job is still building so the progress bar updates
+        time.sleep(0.5)
+        st.experimental_rerun()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
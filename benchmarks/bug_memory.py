@@ -0,0 +1,73 @@
+# benchmarks/bug_memory.py
+"""Bytes per bug held in memory for each in-process representation.
+
+Builds the same bugs as a plain dataclass (the layout before slots were
+added), the slotted Bug and the tuple-backed BugRow, and measures the
+allocations of each with tracemalloc. Field values are created once and
+shared, so only the per-object overhead is compared.
+
+    python -m benchmarks.bug_memory [count]
+"""
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
+import sys
+import tracemalloc
+from src.models.bug import Bug, BugRow, Severity, Priority, Status
+
+@dataclass
+class DictBug:
+    id: str
+    title: str
+    description: str
+    severity: Severity
+    priority: Priority
+    status: Status
+    assigned_to: str
+    created_by: str
+    created_at: datetime
+    updated_at: datetime
+    steps_to_reproduce: str
+    expected_result: str
+    actual_result: str
+    version: int = 1
+
+def _values(count: int) -> list:
+    start = datetime(2024, 1, 1)
+    return [(
+        f"bug-{i}",
+        f"Bug {i}",
+        "Description",
+        Severity.HIGH,
+        Priority.MEDIUM,
+        Status.OPEN,
+        "john.doe",
+        "jane.doe",
+        start + timedelta(minutes=i),
+        start + timedelta(minutes=i),
+        "Steps",
+        "Expected",
+        "Actual"
+    ) for i in range(count)]
+
+def _bytes_per_bug(cls, values: list) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    bugs = [cls(*row) for row in values]
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    # The list holding the bugs is not part of their footprint
+    return (allocated - sys.getsizeof(bugs)) / len(bugs)
+
+def main(count: int = 100000):
+    assert [field.name for field in fields(Bug)] == list(BugRow._fields)
+    values = _values(count)
+    baseline = _bytes_per_bug(DictBug, values)
+    print(f"{'representation':<24}{'bytes/bug':>10}{'vs dict':>10}")
+    for name, cls in [('dataclass with __dict__', DictBug),
+                      ('Bug (slots)', Bug),
+                      ('BugRow (tuple)', BugRow)]:
+        size = _bytes_per_bug(cls, values)
+        print(f"{name:<24}{size:>10.0f}{size / baseline:>10.0%}")
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -2,22 +2,53 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-from src.database.db_manager import DatabaseManager
-from src.services.bug_service import BugService
-from src.services.analytics_service import AnalyticsService
+from src.models.bug import Status, Severity, Priority
+from src.services.analytics_service import TREND_PERIODS
+from src.utils.streamlit_cache import (
+    get_analytics_service,
+    load_bug_frame,
+    load_bug_statistics,
+    load_open_bug_age_histogram,
+    load_priority_severity_table,
+    load_resolution_time_stats,
+    load_trend,
+    load_weekly_flow
+)
 
-st.set_page_config(page_title="Bug Analytics", page_icon="📊", layout="wide")
+def format_duration(duration) -> str:
+    if duration is None:
+        return "n/a"
+    hours = duration.total_seconds() / 3600
+    return f"{hours:.1f} hours" if hours < 48 else f"{hours / 24:.1f} days"
 
-# Initialize services
-db_manager = DatabaseManager()
-bug_service = BugService(db_manager)
-analytics_service = AnalyticsService()
+st.set_page_config(page_title="Bug Analytics", page_icon="📊", layout="wide")
 
 st.title("Bug Analytics Dashboard")
 
-# Get all bugs and calculate statistics
-all_bugs = bug_service.get_all_bugs()
-stats = analytics_service.get_bug_statistics(all_bugs)
+# Filters
+col1, col2, col3 = st.columns(3)
+with col1:
+    status_filter = st.multiselect("Status", [s.value for s in Status])
+with col2:
+    severity_filter = st.multiselect("Severity", [s.value for s in Severity])
+with col3:
+    priority_filter = st.multiselect("Priority", [p.value for p in Priority])
+filters = {
+    'status_filter': status_filter,
+    'severity_filter': severity_filter,
+    'priority_filter': priority_filter
+}
+
+# All bugs are summarized from the counters table and SQL aggregates; a
+# filtered view loads just the matching bugs into one columnar frame
+if any(filters.values()):
+    analytics_service = get_analytics_service()
+    frame = load_bug_frame(filters)
+    stats = analytics_service.get_frame_statistics(frame)
+    pivot_table = analytics_service.get_priority_severity_frame(frame)
+else:
+    stats = load_bug_statistics()
+    pivot_table = load_priority_severity_table()
 
 # Display metrics
 col1, col2, col3 = st.columns(3)
@@ -55,27 +86,53 @@ with col2:
     else:
         st.info("No severity data available")
 
-# Show trend over time
-if all_bugs:
+# Show trend over time, read from the per-period rollup
+if stats['total_bugs']:
     st.subheader("Bug Creation Trend")
-    dates = [bug.created_at.date() for bug in all_bugs]
-    date_counts = pd.Series(dates).value_counts().sort_index()
-    trend_data = pd.DataFrame({
-        'Date': date_counts.index,
-        'Count': date_counts.values
-    })
+    granularity = st.radio("Granularity", list(TREND_PERIODS), horizontal=True)
+    trend = load_trend(granularity, filters)
+    trend_data = pd.DataFrame({'Date': trend.index, 'Count': trend.values})
     fig = px.line(trend_data, x='Date', y='Count', title='Bug Creation Trend Over Time')
     st.plotly_chart(fig, use_container_width=True)
 
 # Priority Analysis
 st.subheader("Priority vs Severity Analysis")
-if all_bugs:
-    priority_severity = pd.DataFrame([
-        {'Priority': bug.priority.value, 'Severity': bug.severity.value}
-        for bug in all_bugs
-    ])
-    pivot_table = pd.crosstab(priority_severity['Priority'], priority_severity['Severity'])
+if stats['total_bugs']:
     fig = px.imshow(pivot_table, 
                     labels=dict(x="Severity", y="Priority", color="Count"),
                     title="Priority vs Severity Heatmap")
-    st.plotly_chart(fig, use_container_width=True)
\ No newline at end of file
+    st.plotly_chart(fig, use_container_width=True)
+
+# Resolution and throughput, aggregated in the database from status history
+st.subheader("Time to Resolve")
+resolution = load_resolution_time_stats(filters)
+col1, col2, col3 = st.columns(3)
+with col1:
+    st.metric("Mean", format_duration(resolution['mean']))
+with col2:
+    st.metric("Median", format_duration(resolution['median']))
+with col3:
+    st.metric("90th Percentile", format_duration(resolution['p90']))
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.subheader("Open Bug Age")
+    ages = load_open_bug_age_histogram(filters)
+    if any(ages.values()):
+        age_data = pd.DataFrame(list(ages.items()), columns=['Age', 'Count'])
+        fig = px.bar(age_data, x='Age', y='Count', title='Open Bugs by Age')
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("No open bugs")
+
+with col2:
+    st.subheader("Weekly Inflow vs Outflow")
+    st.caption("All bugs, whatever the filters")
+    flow = load_weekly_flow()
+    if not flow.empty:
+        fig = px.line(flow, x='Week', y=['Opened', 'Resolved'],
+                      title='Bugs Opened and Resolved per Week')
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("No activity yet")
\ No newline at end of file
@@ -2,17 +2,14 @@
 import streamlit as st
 import pandas as pd
 from src.models.bug import Status, Severity, Priority
-from src.database.db_manager import DatabaseManager
-from src.services.bug_service import BugService
+from src.utils.streamlit_cache import load_bug, load_bug_page, load_search_results
 
 st.set_page_config(page_title="Bug List", page_icon="📋", layout="wide")
 
-# Initialize services
-db_manager = DatabaseManager()
-bug_service = BugService(db_manager)
-
 st.title("Bug List")
 
+search_query = st.text_input("Search", placeholder="Words in the title, description, steps or actual result")
+
 # Filters
 col1, col2, col3 = st.columns(3)
 with col1:
@@ -31,12 +28,31 @@ with col3:
         [p.value for p in Priority]
     )
 
-# Get filtered bugs
-bugs = bug_service.get_filtered_bugs(
-    status_filter,
-    severity_filter,
-    priority_filter
-)
+page_size = st.selectbox("Bugs per page", [25, 50, 100], index=1)
+
+# Restart from the first page whenever the filters change
+filters = {
+    'status_filter': status_filter,
+    'severity_filter': severity_filter,
+    'priority_filter': priority_filter
+}
+if st.session_state.get('bug_list_filters') != filters:
+    st.session_state.bug_list_filters = filters
+    st.session_state.bug_list_cursors = [None]
+cursors = st.session_state.bug_list_cursors
+
+# Get the best search matches, or one page of filtered bugs
+snippets = {}
+if search_query.strip():
+    results = load_search_results(search_query, filters, limit=page_size)
+    bugs = [result.bug for result in results]
+    snippets = {result.bug.id: result.snippet for result in results}
+else:
+    bugs, next_cursor = load_bug_page(
+        filters,
+        cursor=cursors[-1],
+        limit=page_size
+    )
 
 # Display bugs in a table
 if bugs:
@@ -52,6 +68,20 @@ if bugs:
     
     df = pd.DataFrame(bug_data)
     st.dataframe(df)
+
+    if snippets:
+        for bug in bugs:
+            st.markdown(f"**{bug.title}** ({bug.id[:8]}): {snippets[bug.id]}")
+    else:
+        col1, col2, col3 = st.columns([1, 1, 4])
+        with col1:
+            st.button("Previous page", on_click=cursors.pop,
+                      disabled=len(cursors) == 1)
+        with col2:
+            st.button("Next page", on_click=cursors.append, args=(next_cursor,),
+                      disabled=next_cursor is None)
+        with col3:
+            st.caption(f"Page {len(cursors)}")
     
     # Add bug details viewer
     if st.checkbox("View Bug Details"):
@@ -61,7 +91,8 @@ if bugs:
             format_func=lambda x: f"{x[:8]} - {next((b.title for b in bugs if b.id == x), '')}"
         )
         
-        selected_bug = next((bug for bug in bugs if bug.id == selected_id), None)
+        # The list only holds summaries; fetch the long text fields for this bug alone
+        selected_bug = load_bug(selected_id)
         if selected_bug:
             with st.expander("Bug Details", expanded=True):
                 col1, col2 = st.columns(2)
@@ -1,14 +1,20 @@
 # pages/create_bug.py
 import streamlit as st
 from src.models.bug import Status, Severity, Priority
-from src.database.db_manager import DatabaseManager
-from src.services.bug_service import BugService
+from src.utils.streamlit_cache import get_bug_service
 
 st.set_page_config(page_title="Create Bug", page_icon="🐛", layout="wide")
 
 # Initialize services
-db_manager = DatabaseManager()
-bug_service = BugService(db_manager)
+bug_service = get_bug_service()
+
+def create_bug(bug_data: dict):
+    try:
+        bug = bug_service.create_bug(bug_data)
+        st.success(f"Bug created successfully! ID: {bug.id}")
+        st.balloons()
+    except Exception as e:
+        st.error(f"Error creating bug: {str(e)}")
 
 st.title("Create New Bug")
 
@@ -49,10 +55,29 @@ with st.form("bug_form"):
                 'actual_result': actual,
                 'created_by': "current_user"  # In a real app, get from auth
             }
-            
-            try:
-                bug = bug_service.create_bug(bug_data)
-                st.success(f"Bug created successfully! ID: {bug.id}")
-                st.balloons()
-            except Exception as e:
-                st.error(f"Error creating bug: {str(e)}")
\ No newline at end of file
+
+            # Check before saving, so a duplicate can still be dropped
+            duplicates = bug_service.find_duplicates(bug_data)
+            if duplicates:
+                st.session_state.pending_bug = (bug_data, duplicates)
+            else:
+                st.session_state.pop('pending_bug', None)
+                create_bug(bug_data)
+
+if 'pending_bug' in st.session_state:
+    bug_data, duplicates = st.session_state.pending_bug
+    st.warning("This bug looks similar to existing reports:")
+    for duplicate, similarity in duplicates:
+        st.markdown(
+            f"- **{duplicate.title}** ({duplicate.id[:8]}, "
+            f"{duplicate.status.value}) - {similarity:.0%} similar"
+        )
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("Create Anyway"):
+            del st.session_state.pending_bug
+            create_bug(bug_data)
+    with col2:
+        if st.button("Discard"):
+            del st.session_state.pending_bug
+            st.experimental_rerun()
\ No newline at end of file
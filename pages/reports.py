@@ -1,20 +1,33 @@
 # pages/reports.py
 import streamlit as st
-from src.database.db_manager import DatabaseManager
-from src.services.bug_service import BugService
-from src.services.report_service import ReportService
+import time
+from src.utils.streamlit_cache import (
+    get_bug_service,
+    get_report_job_service,
+    load_bug_summaries
+)
+from src.services.report_job_service import JobStatus, REPORT_FORMATS
+
+PREVIEW_ROWS = 1000
+
+MIME_TYPES = {
+    'Excel': "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    'PDF': "application/pdf",
+    'CSV': "text/csv",
+    'Parquet': "application/vnd.apache.parquet",
+    'Arrow': "application/vnd.apache.arrow.file",
+}
 
 st.set_page_config(page_title="Bug Reports", page_icon="📑", layout="wide")
 
 # Initialize services
-db_manager = DatabaseManager()
-bug_service = BugService(db_manager)
-report_service = ReportService()
+bug_service = get_bug_service()
+report_jobs = get_report_job_service()
 
 st.title("Generate Bug Reports")
 
 # Report configuration
-report_type = st.radio("Report Format", ["Excel", "PDF"])
+report_type = st.radio("Report Format", list(REPORT_FORMATS))
 
 # Date range selector
 col1, col2 = st.columns(2)
@@ -30,51 +43,48 @@ with st.expander("Additional Filters"):
     priority_filter = st.multiselect("Priority", ["Low", "Medium", "High"])
 
 if st.button("Generate Report"):
-    bugs = bug_service.get_all_bugs()
-    
-    # Apply date filter
-    if start_date and end_date:
-        bugs = [bug for bug in bugs 
-               if start_date <= bug.created_at.date() <= end_date]
-    
-    # Apply additional filters
-    if status_filter:
-        bugs = [bug for bug in bugs if bug.status.value in status_filter]
-    if severity_filter:
-        bugs = [bug for bug in bugs if bug.severity.value in severity_filter]
-    if priority_filter:
-        bugs = [bug for bug in bugs if bug.priority.value in priority_filter]
+    filters = {
+        'status_filter': status_filter,
+        'severity_filter': severity_filter,
+        'priority_filter': priority_filter,
+        'start_date': start_date,
+        'end_date': end_date
+    }
     
-    if not bugs:
+    if not bug_service.count_bugs(filters):
         st.warning("No bugs found matching the selected criteria.")
+        st.session_state.pop('report_job_id', None)
     else:
-        try:
-            if report_type == "Excel":
-                filepath = report_service.generate_excel_report(bugs, "bug_report")
-                mime_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                file_extension = "xlsx"
-            else:
-                filepath = report_service.generate_pdf_report(bugs, "bug_report")
-                mime_type = "application/pdf"
-                file_extension = "pdf"
-            
-            st.success(f"Report generated successfully!")
-            
-            # Add download button
-            with open(filepath, 'rb') as file:
-                st.download_button(
-                    label="Download Report",
-                    data=file,
-                    file_name=f"bug_report.{file_extension}",
-                    mime=mime_type
-                )
-        except Exception as e:
-            st.error(f"Error generating report: {str(e)}")
+        # Identical requests against unchanged data reuse the finished job
+        st.session_state.report_job_id = report_jobs.submit(report_type, filters)
+
+job_id = st.session_state.get('report_job_id')
+job = report_jobs.get_job(job_id) if job_id else None
+polling = False
+if job is not None:
+    if job.status == JobStatus.FAILED:
+        st.error(f"Error generating report: {job.error}")
+    elif job.status == JobStatus.DONE:
+        st.success(f"Report generated successfully!")
+        
+        # Add download button
+        with open(job.filepath, 'rb') as file:
+            st.download_button(
+                label="Download Report",
+                data=file,
+                file_name=f"bug_report.{REPORT_FORMATS[job.report_format]}",
+                mime=MIME_TYPES[job.report_format]
+            )
+    else:
+        st.progress(job.progress,
+                    text=f"{job.status.value}: {job.rows_written} of {job.total_rows} bugs")
+        polling = True
 
 # Show preview of data being included in report
 if st.checkbox("Show Data Preview"):
-    bugs = bug_service.get_all_bugs()
+    bugs = load_bug_summaries(limit=PREVIEW_ROWS)
     if bugs:
+        st.caption(f"Newest {len(bugs)} bugs")
         preview_data = [{
             'ID': bug.id,
             'Title': bug.title,
@@ -83,4 +93,9 @@ if st.checkbox("Show Data Preview"):
             'Priority': bug.priority.value,
             'Created At': bug.created_at.strftime('%Y-%m-%d %H:%M')
         } for bug in bugs]
-        st.dataframe(preview_data)
\ No newline at end of file
+        st.dataframe(preview_data)
+
+# Rerun while the job is still building so its progress bar updates
+if polling:
+    time.sleep(0.5)
+    st.experimental_rerun()
\ No newline at end of file
@@ -1,10 +1,23 @@
 # src/database/db_manager.py
-from sqlalchemy import create_engine, Column, String, DateTime, Enum
+from sqlalchemy import create_engine, event, Column, String, DateTime, Enum, Index, Integer, func, insert, text, tuple_
+from sqlalchemy import LargeBinary, and_, case, column, inspect, literal_column, or_, select, table, type_coerce, union_all, update
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from typing import List, Optional
-from ..models.bug import Bug, Status, Severity, Priority
+from sqlalchemy.engine import make_url
+from contextlib import contextmanager
+from dataclasses import fields
+from datetime import date, datetime, time, timedelta
+from collections import Counter
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from ..models.bug import Bug, BugEvent, BugEventType, BugRow, BugSummary, SearchResult, Status, Severity, Priority
+from ..utils import minhash
+import json
 import os
+import re
+import sys
+import threading
+import pandas as pd
 
 Base = declarative_base()
 
@@ -24,14 +37,543 @@ class BugModel(Base):
     steps_to_reproduce = Column(String)
     expected_result = Column(String)
     actual_result = Column(String)
+    version = Column(Integer, nullable=False, default=1, server_default='1')
+
+    __table_args__ = (
+        Index('ix_bugs_status_created_at', 'status', 'created_at'),
+        Index('ix_bugs_assigned_to_status', 'assigned_to', 'status'),
+        Index('ix_bugs_severity_priority', 'severity', 'priority'),
+        Index('ix_bugs_created_at_id', 'created_at', 'id'),
+    )
+
+# Columns loaded for list views, in BugSummary field order
+_SUMMARY_COLUMNS = [getattr(BugModel, field.name) for field in fields(BugSummary)]
+
+class BugStatModel(Base):
+    """Running bug counts per dimension value, maintained by triggers on bugs"""
+    __tablename__ = 'bug_stats'
+
+    dimension = Column(String, primary_key=True)
+    value = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+class BugSearchIdModel(Base):
+    """Stable integer key of each bug in the full-text index.
+
+    bugs has a string primary key, so its implicit rowid may be renumbered
+    by VACUUM; an INTEGER PRIMARY KEY never is.
+    """
+    __tablename__ = 'bug_search_ids'
+
+    id = Column(Integer, primary_key=True)
+    bug_id = Column(String, nullable=False, unique=True)
+
+class BugTrendModel(Base):
+    """Bugs created per period, split by status, severity and priority, maintained by triggers"""
+    __tablename__ = 'bug_trends'
+
+    granularity = Column(String, primary_key=True)
+    period = Column(String, primary_key=True)
+    status = Column(Enum(Status), primary_key=True)
+    severity = Column(Enum(Severity), primary_key=True)
+    priority = Column(Enum(Priority), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+class BugSignatureModel(Base):
+    """MinHash signature of each bug's title, description and actual result"""
+    __tablename__ = 'bug_signatures'
+
+    bug_id = Column(String, primary_key=True)
+    signature = Column(LargeBinary, nullable=False)
+
+class BugLshBucketModel(Base):
+    """LSH band buckets; bugs sharing any (band, bucket) are duplicate candidates"""
+    __tablename__ = 'bug_lsh_buckets'
+
+    band = Column(Integer, primary_key=True)
+    bucket = Column(Integer, primary_key=True)
+    bug_id = Column(String, primary_key=True)
+
+    __table_args__ = (
+        Index('ix_bug_lsh_buckets_bug_id', 'bug_id'),
+    )
+
+class BugTransitionModel(Base):
+    """Status history, one row per change, recorded by triggers on bugs"""
+    __tablename__ = 'bug_transitions'
+
+    id = Column(Integer, primary_key=True)
+    bug_id = Column(String, nullable=False)
+    from_status = Column(Enum(Status))
+    to_status = Column(Enum(Status), nullable=False)
+    changed_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index('ix_bug_transitions_bug_id', 'bug_id'),
+        Index('ix_bug_transitions_to_status_changed_at', 'to_status', 'changed_at'),
+    )
+
+class BugEventModel(Base):
+    """Append-only change feed written by triggers on bugs; ids never repeat"""
+    __tablename__ = 'bug_events'
+
+    id = Column(Integer, primary_key=True)
+    bug_id = Column(String, nullable=False)
+    event_type = Column(Enum(BugEventType), nullable=False)
+    changes = Column(String, nullable=False)
+    occurred_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index('ix_bug_events_bug_id', 'bug_id'),
+        {'sqlite_autoincrement': True},
+    )
+
+class BugMetaModel(Base):
+    """Database-wide counters, such as the change version shared by every process"""
+    __tablename__ = 'bug_meta'
+
+    key = Column(String, primary_key=True)
+    value = Column(Integer, nullable=False)
+
+_ENUM_COLUMNS = {
+    'status': Status,
+    'severity': Severity,
+    'priority': Priority,
+}
+
+_DATETIME_COLUMNS = {'created_at', 'updated_at'}
+
+# Enum columns store member names, so the counters are keyed by name as well
+_STATS_DIMENSIONS = {
+    'status': 'status',
+    'severity': 'severity',
+    'priority': 'priority',
+}
+
+def _stats_increment(row: str) -> str:
+    """SQL counting one more bug for each non-NULL dimension value of a trigger row"""
+    values = ' UNION ALL '.join(
+        f"SELECT '{dimension}' AS dimension, {row}.{expression} AS value"
+        for dimension, expression in _STATS_DIMENSIONS.items())
+    return (f"INSERT INTO bug_stats (dimension, value, count) "
+            f"SELECT dimension, value, 1 FROM ({values}) WHERE value IS NOT NULL "
+            f"ON CONFLICT (dimension, value) DO UPDATE SET count = count + 1;")
+
+# A NULL value is not counted; the decrements below never match one either
+_STATS_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS bugs_stats_insert AFTER INSERT ON bugs
+    BEGIN
+        {_stats_increment('NEW')}
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS bugs_stats_delete AFTER DELETE ON bugs
+    BEGIN
+        UPDATE bug_stats SET count = count - 1 WHERE dimension = 'status' AND value = OLD.status;
+        UPDATE bug_stats SET count = count - 1 WHERE dimension = 'severity' AND value = OLD.severity;
+        UPDATE bug_stats SET count = count - 1 WHERE dimension = 'priority' AND value = OLD.priority;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS bugs_stats_update
+    AFTER UPDATE OF status, severity, priority ON bugs
+    BEGIN
+        UPDATE bug_stats SET count = count - 1 WHERE dimension = 'status' AND value = OLD.status;
+        UPDATE bug_stats SET count = count - 1 WHERE dimension = 'severity' AND value = OLD.severity;
+        UPDATE bug_stats SET count = count - 1 WHERE dimension = 'priority' AND value = OLD.priority;
+        {_stats_increment('NEW')}
+    END
+    """,
+]
+
+# Start date of the period holding a timestamp; weeks start on Monday
+_TREND_PERIODS = {
+    'day': "date({0})",
+    'week': "date({0}, '-6 days', 'weekday 1')",
+    'month': "date({0}, 'start of month')",
+}
+
+# Bugs without a creation date or with a NULL enum have no place in the rollup
+_TREND_ROW_COMPLETE = ("date({0}.created_at) IS NOT NULL AND {0}.status IS NOT NULL "
+                       "AND {0}.severity IS NOT NULL AND {0}.priority IS NOT NULL")
+
+_TREND_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS bugs_trends_insert AFTER INSERT ON bugs
+    BEGIN
+        INSERT INTO bug_trends (granularity, period, status, severity, priority, count)
+        SELECT * FROM (VALUES
+            ('day', date(NEW.created_at), NEW.status, NEW.severity, NEW.priority, 1),
+            ('week', date(NEW.created_at, '-6 days', 'weekday 1'), NEW.status, NEW.severity, NEW.priority, 1),
+            ('month', date(NEW.created_at, 'start of month'), NEW.status, NEW.severity, NEW.priority, 1))
+        WHERE {_TREND_ROW_COMPLETE.format('NEW')}
+        ON CONFLICT (granularity, period, status, severity, priority) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS bugs_trends_delete AFTER DELETE ON bugs
+    BEGIN
+        UPDATE bug_trends SET count = count - 1
+        WHERE status = OLD.status AND severity = OLD.severity AND priority = OLD.priority AND (
+            (granularity = 'day' AND period = date(OLD.created_at)) OR
+            (granularity = 'week' AND period = date(OLD.created_at, '-6 days', 'weekday 1')) OR
+            (granularity = 'month' AND period = date(OLD.created_at, 'start of month')));
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS bugs_trends_update
+    AFTER UPDATE OF status, severity, priority, created_at ON bugs
+    BEGIN
+        UPDATE bug_trends SET count = count - 1
+        WHERE status = OLD.status AND severity = OLD.severity AND priority = OLD.priority AND (
+            (granularity = 'day' AND period = date(OLD.created_at)) OR
+            (granularity = 'week' AND period = date(OLD.created_at, '-6 days', 'weekday 1')) OR
+            (granularity = 'month' AND period = date(OLD.created_at, 'start of month')));
+        INSERT INTO bug_trends (granularity, period, status, severity, priority, count)
+        SELECT * FROM (VALUES
+            ('day', date(NEW.created_at), NEW.status, NEW.severity, NEW.priority, 1),
+            ('week', date(NEW.created_at, '-6 days', 'weekday 1'), NEW.status, NEW.severity, NEW.priority, 1),
+            ('month', date(NEW.created_at, 'start of month'), NEW.status, NEW.severity, NEW.priority, 1))
+        WHERE {_TREND_ROW_COMPLETE.format('NEW')}
+        ON CONFLICT (granularity, period, status, severity, priority) DO UPDATE SET count = count + 1;
+    END
+    """,
+]
+
+# External-content FTS5 index over the searchable text columns
+_SEARCH_COLUMNS = ['title', 'description', 'steps_to_reproduce', 'actual_result']
+# bm25 column weights, in _SEARCH_COLUMNS order
+_SEARCH_WEIGHTS = [10.0, 2.0, 1.0, 2.0]
+
+# The index reads bug text through this view, keyed by bug_search_ids.id
+_SEARCH_CONTENT = f"""
+    CREATE VIEW IF NOT EXISTS bugs_search AS
+    SELECT bug_search_ids.id AS search_id, {', '.join('bugs.' + name for name in _SEARCH_COLUMNS)}
+    FROM bug_search_ids JOIN bugs ON bugs.id = bug_search_ids.bug_id
+"""
+
+_SEARCH_TABLE = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS bugs_fts USING fts5(
+        {', '.join(_SEARCH_COLUMNS)},
+        content='bugs_search', content_rowid='search_id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+"""
+
+_SEARCH_ID = "(SELECT id FROM bug_search_ids WHERE bug_id = {0}.id)"
+
+_SEARCH_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS bugs_fts_insert AFTER INSERT ON bugs
+    BEGIN
+        INSERT INTO bug_search_ids (bug_id) VALUES (NEW.id);
+        INSERT INTO bugs_fts (rowid, {', '.join(_SEARCH_COLUMNS)})
+        VALUES (last_insert_rowid(), {', '.join('NEW.' + name for name in _SEARCH_COLUMNS)});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS bugs_fts_delete AFTER DELETE ON bugs
+    BEGIN
+        INSERT INTO bugs_fts (bugs_fts, rowid, {', '.join(_SEARCH_COLUMNS)})
+        VALUES ('delete', {_SEARCH_ID.format('OLD')}, {', '.join('OLD.' + name for name in _SEARCH_COLUMNS)});
+        DELETE FROM bug_search_ids WHERE bug_id = OLD.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS bugs_fts_update AFTER UPDATE OF id, {', '.join(_SEARCH_COLUMNS)} ON bugs
+    BEGIN
+        INSERT INTO bugs_fts (bugs_fts, rowid, {', '.join(_SEARCH_COLUMNS)})
+        VALUES ('delete', {_SEARCH_ID.format('OLD')}, {', '.join('OLD.' + name for name in _SEARCH_COLUMNS)});
+        UPDATE bug_search_ids SET bug_id = NEW.id WHERE bug_id = OLD.id;
+        INSERT INTO bugs_fts (rowid, {', '.join(_SEARCH_COLUMNS)})
+        VALUES ({_SEARCH_ID.format('NEW')}, {', '.join('NEW.' + name for name in _SEARCH_COLUMNS)});
+    END
+    """,
+]
+
+_DUPLICATE_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS bugs_duplicates_delete AFTER DELETE ON bugs
+    BEGIN
+        DELETE FROM bug_lsh_buckets WHERE bug_id = OLD.id;
+        DELETE FROM bug_signatures WHERE bug_id = OLD.id;
+    END
+    """,
+]
+
+_DUPLICATE_COLUMNS = {'title', 'description', 'actual_result'}
+
+# The current local time in SQLAlchemy's DateTime storage format
+_SQLITE_NOW = "strftime('%Y-%m-%d %H:%M:%f000', 'now', 'localtime')"
+
+# A status change is stamped with the new updated_at, or the current time
+# when the write left updated_at alone. A bug inserted in another status
+# (as imports do) is taken to have been opened when created and moved to
+# that status at its updated_at, the same as the backfill below.
+_TRANSITION_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS bugs_transitions_insert AFTER INSERT ON bugs
+    BEGIN
+        INSERT INTO bug_transitions (bug_id, from_status, to_status, changed_at)
+        VALUES (NEW.id, NULL, 'OPEN', COALESCE(NEW.created_at, {_SQLITE_NOW}));
+        INSERT INTO bug_transitions (bug_id, from_status, to_status, changed_at)
+        SELECT NEW.id, 'OPEN', NEW.status,
+               COALESCE(NEW.updated_at, NEW.created_at, {_SQLITE_NOW})
+        WHERE NEW.status != 'OPEN';
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS bugs_transitions_update AFTER UPDATE OF status ON bugs
+    WHEN OLD.status IS NOT NEW.status
+    BEGIN
+        INSERT INTO bug_transitions (bug_id, from_status, to_status, changed_at)
+        VALUES (NEW.id, OLD.status, NEW.status,
+                CASE WHEN NEW.updated_at IS NOT OLD.updated_at AND NEW.updated_at IS NOT NULL
+                     THEN NEW.updated_at ELSE {_SQLITE_NOW} END);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS bugs_transitions_delete AFTER DELETE ON bugs
+    BEGIN
+        DELETE FROM bug_transitions WHERE bug_id = OLD.id;
+    END
+    """,
+]
+
+# Backfill for databases that predate the history: each bug is taken to have
+# been opened when created and moved to its current status at its last update
+_TRANSITIONS_BACKFILL = """
+    INSERT INTO bug_transitions (bug_id, from_status, to_status, changed_at)
+    SELECT id, NULL, 'OPEN', created_at FROM bugs WHERE created_at IS NOT NULL
+    UNION ALL
+    SELECT id, 'OPEN', status, COALESCE(updated_at, created_at) FROM bugs
+    WHERE status != 'OPEN' AND COALESCE(updated_at, created_at) IS NOT NULL
+"""
+
+_EVENT_FIELDS = [name for name in BugModel.__table__.c.keys() if name not in ('id', 'version')]
+
+def _event_changes(old: Optional[str], new: Optional[str]) -> str:
+    """SQL for a JSON object of {field: [old, new]} holding only the fields that differ.
+
+    old and new are column prefixes such as 'OLD.', or None for a row that
+    does not exist; json_patch drops the NULLs left by unchanged fields.
+    """
+    pairs = []
+    for name in _EVENT_FIELDS:
+        old_value = f"{old}{name}" if old is not None else "NULL"
+        new_value = f"{new}{name}" if new is not None else "NULL"
+        pairs.append(f"'{name}', CASE WHEN {old_value} IS NOT {new_value} "
+                     f"THEN json_array({old_value}, {new_value}) END")
+    return f"json_patch('{{}}', json_object({', '.join(pairs)}))"
+
+_EVENT_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS bugs_events_insert AFTER INSERT ON bugs
+    BEGIN
+        INSERT INTO bug_events (bug_id, event_type, changes, occurred_at)
+        VALUES (NEW.id, 'CREATED', {_event_changes(None, 'NEW.')}, {_SQLITE_NOW});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS bugs_events_update AFTER UPDATE ON bugs
+    WHEN {' OR '.join(f"OLD.{name} IS NOT NEW.{name}" for name in _EVENT_FIELDS)}
+    BEGIN
+        INSERT INTO bug_events (bug_id, event_type, changes, occurred_at)
+        VALUES (NEW.id, 'UPDATED', {_event_changes('OLD.', 'NEW.')}, {_SQLITE_NOW});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS bugs_events_delete AFTER DELETE ON bugs
+    BEGIN
+        INSERT INTO bug_events (bug_id, event_type, changes, occurred_at)
+        VALUES (OLD.id, 'DELETED', {_event_changes('OLD.', None)}, {_SQLITE_NOW});
+    END
+    """,
+]
+
+# Seed the feed of a database that predates it with the current state of
+# each bug, so a consumer starting from the beginning still sees every bug
+_EVENTS_BACKFILL = f"""
+    INSERT INTO bug_events (bug_id, event_type, changes, occurred_at)
+    SELECT id, 'CREATED', {_event_changes(None, '')},
+           COALESCE(updated_at, created_at, {_SQLITE_NOW})
+    FROM bugs ORDER BY created_at, id
+"""
+
+_RESOLVED_STATUSES = [Status.RESOLVED, Status.CLOSED]
+_UNRESOLVED_STATUSES = [Status.OPEN, Status.IN_PROGRESS]
+
+# (label, upper bound in days) for the open bug age histogram
+_AGE_BUCKETS = [
+    ('< 1 day', 1),
+    ('1-7 days', 7),
+    ('1-4 weeks', 28),
+    ('1-3 months', 90),
+    ('> 3 months', None),
+]
+
+# Upper bound on bugs scored per duplicate lookup, in case a bucket is very crowded
+_MAX_DUPLICATE_CANDIDATES = 500
+
+# One engine (and connection pool) per database URL, shared by every DatabaseManager
+_engines = {}
+_engines_lock = threading.Lock()
+
+# Bumped inside every write transaction, so it moves exactly when a write commits
+_CHANGE_VERSION = 'change_version'
+_SEED_CHANGE_VERSION = text(
+    "INSERT OR IGNORE INTO bug_meta (key, value) VALUES (:key, 0)").bindparams(key=_CHANGE_VERSION)
+_BUMP_CHANGE_VERSION = text(
+    "UPDATE bug_meta SET value = value + 1 WHERE key = :key").bindparams(key=_CHANGE_VERSION)
+_READ_CHANGE_VERSION = text(
+    "SELECT value FROM bug_meta WHERE key = :key").bindparams(key=_CHANGE_VERSION)
+
+def _pool_options(db_path: str) -> dict:
+    """Pool sizing from the environment; in-memory SQLite keeps its single-connection pool"""
+    url = make_url(db_path)
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        return {}
+    return {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', '5')),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', '10')),
+        'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', '30')),
+    }
+
+# SQLite tuning applied to every new connection; an empty value leaves SQLite's default
+_SQLITE_PRAGMAS = {
+    'journal_mode': ('DB_JOURNAL_MODE', 'WAL'),
+    'synchronous': ('DB_SYNCHRONOUS', 'NORMAL'),
+    'busy_timeout': ('DB_BUSY_TIMEOUT', '5000'),
+    'cache_size': ('DB_CACHE_SIZE', '-65536'),
+    'mmap_size': ('DB_MMAP_SIZE', '268435456'),
+    'temp_store': ('DB_TEMP_STORE', 'MEMORY'),
+}
+
+def _normalize_sql(sql: str) -> str:
+    """Statement text as SQLite stores it in sqlite_master, whitespace collapsed"""
+    return ' '.join(sql.replace('IF NOT EXISTS ', '', 1).split())
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Share one string object for user names repeated across many rows"""
+    return sys.intern(value) if value is not None else None
+
+def _sqlite_pragmas() -> Dict[str, str]:
+    pragmas = {}
+    for pragma, (env_var, default) in _SQLITE_PRAGMAS.items():
+        value = os.getenv(env_var, default).strip()
+        if not value:
+            continue
+        if not re.fullmatch(r'-?\w+', value):
+            raise ValueError(f"Invalid value for {env_var}: {value!r}")
+        pragmas[pragma] = value
+    return pragmas
+
+def _install_sqlite_pragmas(engine):
+    pragmas = _sqlite_pragmas()
+
+    @event.listens_for(engine, 'connect')
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma, value in pragmas.items():
+            cursor.execute(f"PRAGMA {pragma} = {value}")
+        cursor.close()
 
 class DatabaseManager:
     def __init__(self):
         db_path = os.getenv('DB_PATH', 'sqlite:///bugs.db')
-        self.engine = create_engine(db_path)
-        Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
+        with _engines_lock:
+            self.engine = _engines.get(db_path)
+            if self.engine is None:
+                self.engine = create_engine(db_path, **_pool_options(db_path))
+                if self.engine.dialect.name == 'sqlite':
+                    _install_sqlite_pragmas(self.engine)
+                existing_tables = set(inspect(self.engine).get_table_names())
+                Base.metadata.create_all(self.engine)
+                self._migrate(existing_tables)
+                _engines[db_path] = self.engine
+        self.db_path = db_path
+        self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
+
+    @property
+    def change_version(self) -> int:
+        """Counter stored in the database that moves whenever any process commits a write"""
+        with self.engine.connect() as connection:
+            return connection.execute(_READ_CHANGE_VERSION).scalar()
+
+    def has_changed_since(self, version: int) -> bool:
+        """Whether any write has been committed since change_version returned version"""
+        return self.change_version != version
+
+    @contextmanager
+    def _session_scope(self, write: bool = False):
+        """Session for a single unit of work: commit on success, roll back on error"""
+        session = self.Session()
+        try:
+            yield session
+            if write:
+                self._bump_change_version(session)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _migrate(self, existing_tables: set):
+        """Bring databases created by older versions up to the current schema"""
+        # create_all skips tables that already exist, including their new columns and indexes
+        if 'version' not in {column['name'] for column in inspect(self.engine).get_columns('bugs')}:
+            with self.engine.begin() as connection:
+                connection.exec_driver_sql(
+                    "ALTER TABLE bugs ADD COLUMN version INTEGER NOT NULL DEFAULT 1")
+        for index in BugModel.__table__.indexes:
+            index.create(self.engine, checkfirst=True)
+
+        with self.engine.begin() as connection:
+            connection.execute(_SEED_CHANGE_VERSION)
+            replaced = self._install_triggers(connection, _STATS_TRIGGERS)
+            # Seed the counters the first time they are added to an existing database,
+            # and recount when older triggers may have kept other counters
+            stats_empty = connection.execute(text("SELECT NOT EXISTS (SELECT 1 FROM bug_stats)")).scalar()
+            bugs_present = connection.execute(text("SELECT EXISTS (SELECT 1 FROM bugs)")).scalar()
+            if (stats_empty and bugs_present) or 'bugs_stats_insert' in replaced:
+                self._rebuild_bug_stats(connection)
+
+            connection.exec_driver_sql(_SEARCH_CONTENT)
+            connection.exec_driver_sql(_SEARCH_TABLE)
+            self._install_triggers(connection, _SEARCH_TRIGGERS)
+            if 'bug_search_ids' not in existing_tables:
+                self._rebuild_search_index(connection)
+
+            self._install_triggers(connection, _DUPLICATE_TRIGGERS)
+            if 'bug_signatures' not in existing_tables:
+                self._rebuild_duplicate_index(connection)
+
+            self._install_triggers(connection, _TREND_TRIGGERS)
+            if 'bug_trends' not in existing_tables:
+                self._rebuild_trends(connection)
+
+            self._install_triggers(connection, _TRANSITION_TRIGGERS)
+            if 'bug_transitions' not in existing_tables:
+                connection.exec_driver_sql(_TRANSITIONS_BACKFILL)
+
+            self._install_triggers(connection, _EVENT_TRIGGERS)
+            if 'bug_events' not in existing_tables:
+                connection.exec_driver_sql(_EVENTS_BACKFILL)
+
+    def _install_triggers(self, connection, triggers: List[str]) -> Set[str]:
+        """Create missing triggers and replace those whose definition changed, returning the replaced names"""
+        stored = dict(connection.execute(text(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'trigger'")).all())
+        replaced = set()
+        for trigger in triggers:
+            name = re.search(r'CREATE TRIGGER IF NOT EXISTS (\w+)', trigger).group(1)
+            if name in stored and _normalize_sql(stored[name]) != _normalize_sql(trigger):
+                connection.exec_driver_sql(f"DROP TRIGGER {name}")
+                replaced.add(name)
+            connection.exec_driver_sql(trigger)
+        return replaced
 
     def save_bug(self, bug: Bug) -> Bug:
         bug_model = BugModel(
@@ -50,39 +592,617 @@ class DatabaseManager:
             actual_result=bug.actual_result
         )
         
-        self.session.add(bug_model)
-        self.session.commit()
+        with self._session_scope(write=True) as session:
+            session.add(bug_model)
+            self._index_duplicates(session, [self._bug_to_row(bug)])
         return bug
 
+    def save_bugs(self, bugs: Iterable[Bug], batch_size: int = 1000) -> int:
+        """Insert bugs in batches, committing once per batch"""
+        statement = insert(BugModel.__table__)
+        bugs = iter(bugs)
+        saved = 0
+        while True:
+            batch = [self._bug_to_row(bug) for bug in islice(bugs, batch_size)]
+            if not batch:
+                return saved
+            with self._session_scope(write=True) as session:
+                session.execute(statement, batch)
+                self._index_duplicates(session, batch)
+            saved += len(batch)
+
     def get_bug(self, bug_id: str) -> Optional[Bug]:
-        bug_model = self.session.query(BugModel).filter_by(id=bug_id).first()
-        if not bug_model:
-            return None
-        return self._convert_to_bug(bug_model)
+        with self._session_scope() as session:
+            bug_model = session.query(BugModel).filter_by(id=bug_id).first()
+            if not bug_model:
+                return None
+            return self._convert_to_bug(bug_model)
 
     def update_bug(self, bug: Bug) -> Bug:
-        bug_model = self.session.query(BugModel).filter_by(id=bug.id).first()
-        if bug_model:
-            for key, value in bug.__dict__.items():
-                setattr(bug_model, key, value)
-            self.session.commit()
+        with self._session_scope(write=True) as session:
+            bug_model = session.query(BugModel).filter_by(id=bug.id).first()
+            if bug_model:
+                row = self._bug_to_row(bug)
+                for key, value in row.items():
+                    if key != 'version':
+                        setattr(bug_model, key, value)
+                bug_model.version += 1
+                bug.version = bug_model.version
+                self._unindex_duplicates(session, bug.id)
+                self._index_duplicates(session, [row])
         return bug
 
+    def update_bug_fields(self, bug_id: str, changes: dict,
+                          expected_version: Optional[int] = None) -> Tuple[Optional[Bug], bool]:
+        """Write only the changed columns in one UPDATE, returning (bug, conflict).
+
+        With expected_version the row is only written if nobody else has
+        updated it since; otherwise nothing changes and conflict is True.
+        """
+        unknown = set(changes) - (set(BugModel.__table__.c.keys()) - {'version'})
+        if unknown:
+            raise ValueError(f"Unknown bug fields: {', '.join(sorted(unknown))}")
+
+        bugs = BugModel.__table__
+        statement = update(bugs).where(bugs.c.id == bug_id)
+        if expected_version is not None:
+            statement = statement.where(bugs.c.version == expected_version)
+        statement = statement.values(**changes, version=bugs.c.version + 1).returning(*bugs.c)
+
+        with self._session_scope(write=True) as session:
+            row = session.execute(statement).first()
+            if row is None:
+                # Either the bug is gone or another writer got there first
+                exists = session.query(BugModel.id).filter_by(id=bug_id).first() is not None
+                return None, exists
+            bug = self._convert_to_bug(row)
+            if _DUPLICATE_COLUMNS & set(changes):
+                self._unindex_duplicates(session, bug_id)
+                self._index_duplicates(session, [self._bug_to_row(bug)])
+            return bug, False
+
+    def update_status(self, status: Status, **filters) -> int:
+        """Move every bug matching the filters to a new status with one UPDATE"""
+        with self._session_scope(write=True) as session:
+            query = self._apply_filters(session.query(BugModel), **filters)
+            return query.filter(BugModel.status != status).update(
+                {BugModel.status: status, BugModel.updated_at: datetime.now(),
+                 BugModel.version: BugModel.version + 1},
+                synchronize_session=False
+            )
+
     def get_all_bugs(self) -> List[Bug]:
-        bug_models = self.session.query(BugModel).all()
-        return [self._convert_to_bug(model) for model in bug_models]
+        with self._session_scope() as session:
+            bug_models = session.query(BugModel).all()
+            return [self._convert_to_bug(model) for model in bug_models]
 
     def get_bugs_by_status(self, status: Status) -> List[Bug]:
-        bug_models = self.session.query(BugModel).filter_by(status=status).all()
-        return [self._convert_to_bug(model) for model in bug_models]
+        with self._session_scope() as session:
+            bug_models = session.query(BugModel).filter_by(status=status).all()
+            return [self._convert_to_bug(model) for model in bug_models]
+
+    def get_filtered_bugs(self, status_filter: List[str] = None,
+                          severity_filter: List[str] = None,
+                          priority_filter: List[str] = None,
+                          start_date: Optional[date] = None,
+                          end_date: Optional[date] = None) -> List[Bug]:
+        """Retrieve bugs matching the filters with a single query"""
+        with self._session_scope() as session:
+            query = self._apply_filters(
+                session.query(BugModel),
+                status_filter, severity_filter, priority_filter,
+                start_date, end_date
+            )
+            return [self._convert_to_bug(model) for model in query.all()]
+
+    def iter_bugs(self, batch_size: int = 1000, **filters) -> Iterator[Bug]:
+        """Stream bugs matching the filters, fetching batch_size rows at a time"""
+        query = self._apply_filters(select(BugModel.__table__), **filters).order_by(
+            BugModel.created_at, BugModel.id)
+        with self._session_scope() as session:
+            result = session.execute(query.execution_options(yield_per=batch_size))
+            for row in result:
+                yield self._convert_to_bug(row)
+
+    def iter_bug_rows(self, batch_size: int = 1000, **filters) -> Iterator[BugRow]:
+        """Stream matching bugs as read-only tuples, which pickle smaller than Bug"""
+        bugs = BugModel.__table__
+        query = self._apply_filters(select(*[bugs.c[name] for name in BugRow._fields]), **filters)
+        query = query.order_by(BugModel.created_at, BugModel.id)
+        with self._session_scope() as session:
+            result = session.execute(query.execution_options(yield_per=batch_size))
+            for row in result.tuples():
+                bug = BugRow._make(row)
+                yield bug._replace(assigned_to=_intern(bug.assigned_to),
+                                   created_by=_intern(bug.created_by))
+
+    def iter_column_batches(self, batch_size: int = 10000, columns: Optional[List[str]] = None,
+                            **filters) -> Iterator[Dict[str, tuple]]:
+        """Stream matching bugs as {column: values} batches of the stored values.
+
+        Enum columns hold member names and timestamps their ISO text, skipping
+        the per-row conversions for callers that decode whole columns at once.
+        """
+        table_columns = BugModel.__table__.columns
+        columns = [type_coerce(table_columns[name], String).label(name)
+                   for name in columns or table_columns.keys()]
+        query = self._apply_filters(select(*columns), **filters).order_by(
+            BugModel.created_at, BugModel.id)
+        names = [label.name for label in columns]
+        with self._session_scope() as session:
+            result = session.execute(query.execution_options(yield_per=batch_size))
+            for rows in result.partitions():
+                yield dict(zip(names, zip(*rows)))
+
+    def read_frame(self, columns: Optional[List[str]] = None, batch_size: int = 50000,
+                   **filters) -> pd.DataFrame:
+        """Load matching bugs into a DataFrame without building Bug objects.
+
+        Status, severity and priority become categoricals over every display
+        value, and timestamps datetime64 columns. pd.read_sql is not used as
+        pandas 1.5 does not accept SQLAlchemy 2.0 connections.
+        """
+        columns = columns or BugModel.__table__.columns.keys()
+        frames = [self._column_frame(batch) for batch in
+                  self.iter_column_batches(batch_size, columns, **filters)]
+        if not frames:
+            return self._column_frame({name: () for name in columns})
+        return pd.concat(frames, ignore_index=True)
+
+    def count_bugs(self, **filters) -> int:
+        """Number of bugs matching the filters"""
+        with self._session_scope() as session:
+            return self._apply_filters(session.query(func.count(BugModel.id)), **filters).scalar()
+
+    def get_bugs_page(self, after: Optional[Tuple[datetime, str]] = None,
+                      limit: int = 50, descending: bool = True,
+                      **filters) -> List[BugSummary]:
+        """Retrieve one page of bug summaries ordered by (created_at, id), seeking past `after`"""
+        key = tuple_(BugModel.created_at, BugModel.id)
+        with self._session_scope() as session:
+            query = self._apply_filters(session.query(*_SUMMARY_COLUMNS), **filters)
+            if after is not None:
+                query = query.filter(key < tuple_(*after) if descending else key > tuple_(*after))
+            if descending:
+                query = query.order_by(BugModel.created_at.desc(), BugModel.id.desc())
+            else:
+                query = query.order_by(BugModel.created_at.asc(), BugModel.id.asc())
+            return [BugSummary(*row) for row in query.limit(limit)]
+
+    def get_bug_summaries(self, limit: Optional[int] = None, **filters) -> List[BugSummary]:
+        """Summaries of the matching bugs, newest first"""
+        with self._session_scope() as session:
+            query = self._apply_filters(session.query(*_SUMMARY_COLUMNS), **filters).order_by(
+                BugModel.created_at.desc(), BugModel.id.desc())
+            return [BugSummary(*row) for row in query.limit(limit)]
+
+    def get_bug_statistics(self, **filters) -> Dict:
+        """Calculate bug statistics, from the counters table when unfiltered"""
+        with self._session_scope() as session:
+            if not any(filters.values()):
+                return self._get_stored_statistics(session)
+            status_distribution = self._count_by(session, BugModel.status, **filters)
+            return {
+                'status_distribution': status_distribution,
+                'severity_distribution': self._count_by(session, BugModel.severity, **filters),
+                'priority_distribution': self._count_by(session, BugModel.priority, **filters),
+                'total_bugs': sum(status_distribution.values()),
+                'open_bugs': status_distribution[Status.OPEN.value],
+                'resolved_bugs': status_distribution[Status.RESOLVED.value]
+            }
+
+    def get_priority_severity_counts(self, **filters) -> Dict[Tuple[str, str], int]:
+        """Count bugs per (priority, severity) pair"""
+        with self._session_scope() as session:
+            query = self._apply_filters(
+                session.query(BugModel.priority, BugModel.severity, func.count()),
+                **filters
+            ).group_by(BugModel.priority, BugModel.severity)
+            return {
+                (priority.value, severity.value): count
+                for priority, severity, count in query
+                if priority is not None and severity is not None
+            }
+
+    def get_trend_counts(self, granularity: str, start_date: Optional[date] = None,
+                         end_date: Optional[date] = None, status_filter: List[str] = None,
+                         severity_filter: List[str] = None,
+                         priority_filter: List[str] = None) -> Dict[date, int]:
+        """Bugs created per 'day', 'week' or 'month', read from the rollup table.
+
+        Periods are keyed by their first day; those containing start_date and
+        end_date are counted whole.
+        """
+        if granularity not in _TREND_PERIODS:
+            raise ValueError(f"Unknown granularity: {granularity}")
+        trend = BugTrendModel
+        with self._session_scope() as session:
+            query = session.query(trend.period, func.sum(trend.count)).filter(
+                trend.granularity == granularity, trend.period.isnot(None), trend.count > 0)
+            if status_filter:
+                query = query.filter(trend.status.in_([Status(value) for value in status_filter]))
+            if severity_filter:
+                query = query.filter(
+                    trend.severity.in_([Severity(value) for value in severity_filter]))
+            if priority_filter:
+                query = query.filter(
+                    trend.priority.in_([Priority(value) for value in priority_filter]))
+            if start_date:
+                query = query.filter(trend.period >= self._period_start(granularity, start_date))
+            if end_date:
+                query = query.filter(trend.period <= self._period_start(granularity, end_date))
+            rows = query.group_by(trend.period).order_by(trend.period)
+            return {date.fromisoformat(period): count for period, count in rows}
+
+    def get_resolution_times(self, **filters) -> Dict:
+        """Count, mean, median and 90th percentile of created-to-resolved time in seconds.
+
+        A bug counts once it is Resolved or Closed, resolved at the last time
+        it entered either status; percentiles use the nearest-rank method.
+        """
+        transition = BugTransitionModel
+        entered_resolved = and_(
+            transition.to_status.in_(_RESOLVED_STATUSES),
+            or_(transition.from_status.is_(None),
+                transition.from_status.in_(_UNRESOLVED_STATUSES)))
+        seconds = (func.julianday(func.max(transition.changed_at)) -
+                   func.julianday(BugModel.created_at)) * 86400.0
+        resolved = self._apply_filters(
+            select(seconds.label('seconds'))
+            .select_from(BugModel)
+            .join(transition, transition.bug_id == BugModel.id)
+            .where(BugModel.status.in_(_RESOLVED_STATUSES), entered_resolved),
+            **filters
+        ).group_by(BugModel.id).subquery()
+        ranked = select(
+            resolved.c.seconds,
+            func.cume_dist().over(order_by=resolved.c.seconds).label('cume_dist')
+        ).subquery()
+        query = select(
+            func.count(),
+            func.avg(ranked.c.seconds),
+            func.min(case((ranked.c.cume_dist >= 0.5, ranked.c.seconds))),
+            func.min(case((ranked.c.cume_dist >= 0.9, ranked.c.seconds)))
+        )
+        with self._session_scope() as session:
+            count, mean, median, p90 = session.execute(query).one()
+        return {'count': count, 'mean': mean, 'median': median, 'p90': p90}
+
+    def get_open_bug_ages(self, now: Optional[datetime] = None, **filters) -> Dict[str, int]:
+        """Number of Open and In Progress bugs per age bucket, oldest bucket last"""
+        now = now or datetime.now()
+        age = func.julianday(now.isoformat(sep=' ')) - func.julianday(BugModel.created_at)
+        bucket = case(
+            *[(age < upper, label) for label, upper in _AGE_BUCKETS if upper is not None],
+            else_=_AGE_BUCKETS[-1][0]
+        )
+        with self._session_scope() as session:
+            query = self._apply_filters(
+                session.query(bucket, func.count()).filter(
+                    BugModel.status.in_(_UNRESOLVED_STATUSES)),
+                **filters
+            ).group_by(bucket)
+            counts = dict(query.all())
+        return {label: counts.get(label, 0) for label, _ in _AGE_BUCKETS}
+
+    def get_weekly_flow(self, start_date: Optional[date] = None,
+                        end_date: Optional[date] = None) -> List[Tuple[date, int, int, int]]:
+        """(week, opened, resolved, running net change) per Monday-started week.
+
+        Opened counts created bugs, resolved counts moves from Open or In
+        Progress to Resolved or Closed; the running total is a window sum.
+        """
+        def in_range(column):
+            conditions = []
+            if start_date:
+                conditions.append(column >= datetime.combine(start_date, time.min))
+            if end_date:
+                conditions.append(
+                    column < datetime.combine(end_date + timedelta(days=1), time.min))
+            return and_(True, *conditions)
+
+        transition = BugTransitionModel
+        opened = select(BugModel.created_at.label('at'),
+                        literal_column('1').label('opened'),
+                        literal_column('0').label('resolved')).where(
+            in_range(BugModel.created_at))
+        resolved = select(transition.changed_at.label('at'),
+                          literal_column('0').label('opened'),
+                          literal_column('1').label('resolved')).where(
+            transition.to_status.in_(_RESOLVED_STATUSES),
+            or_(transition.from_status.is_(None),
+                transition.from_status.in_(_UNRESOLVED_STATUSES)),
+            in_range(transition.changed_at))
+        events = union_all(opened, resolved).subquery()
+
+        week = func.date(events.c.at, '-6 days', 'weekday 1').label('week')
+        weekly = select(week, func.sum(events.c.opened).label('opened'),
+                        func.sum(events.c.resolved).label('resolved')
+                        ).group_by(week).subquery()
+        query = select(
+            weekly.c.week, weekly.c.opened, weekly.c.resolved,
+            func.sum(weekly.c.opened - weekly.c.resolved).over(order_by=weekly.c.week)
+        ).order_by(weekly.c.week)
+        with self._session_scope() as session:
+            return [(date.fromisoformat(week), opened, resolved, net)
+                    for week, opened, resolved, net in session.execute(query)]
+
+    def verify_bug_stats(self) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """Compare the counters with the bugs table, returning (stored, actual) per drifted key"""
+        with self.engine.connect() as connection:
+            return self._bug_stats_drift(connection)
+
+    def rebuild_bug_stats(self) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """Recompute the counters from scratch, returning the drift that was corrected"""
+        with self.engine.begin() as connection:
+            drift = self._bug_stats_drift(connection)
+            self._rebuild_bug_stats(connection)
+            self._bump_change_version(connection)
+        return drift
+
+    def search_bugs(self, fts_query: str, limit: int = 20, **filters) -> List[SearchResult]:
+        """Full-text search ranked by BM25, best match first"""
+        search_index = table('bugs_fts', column('rowid'))
+        match_target = literal_column('bugs_fts')
+        rank = func.bm25(match_target, *_SEARCH_WEIGHTS).label('rank')
+        snippet = func.snippet(match_target, -1, '**', '**', '…', 16).label('snippet')
+        with self._session_scope() as session:
+            query = session.query(*_SUMMARY_COLUMNS, rank, snippet).select_from(search_index).join(
+                BugSearchIdModel, BugSearchIdModel.id == search_index.c.rowid
+            ).join(
+                BugModel, BugModel.id == BugSearchIdModel.bug_id
+            ).filter(match_target.op('MATCH')(fts_query))
+            query = self._apply_filters(query, **filters).order_by(rank).limit(limit)
+            return [
+                SearchResult(bug=BugSummary(*row[:-2]), rank=row.rank, snippet=row.snippet)
+                for row in query
+            ]
+
+    def find_similar_bugs(self, text: str, limit: int = 5, threshold: float = 0.5,
+                          exclude_id: Optional[str] = None) -> List[Tuple[Bug, float]]:
+        """Bugs whose text is estimated at least `threshold` similar, most similar first"""
+        sig = minhash.signature(text)
+        if sig is None:
+            return []
+        keys = list(enumerate(minhash.band_buckets(sig)))
+        with self._session_scope() as session:
+            # OR of primary-key lookups; SQLite scans the table for a row-value IN list
+            candidates = session.query(BugLshBucketModel.bug_id).filter(or_(*(
+                and_(BugLshBucketModel.band == band, BugLshBucketModel.bucket == bucket)
+                for band, bucket in keys
+            ))).distinct().limit(_MAX_DUPLICATE_CANDIDATES)
+            rows = session.query(BugSignatureModel).filter(
+                BugSignatureModel.bug_id.in_(candidates.scalar_subquery()))
+            scored = sorted(
+                ((minhash.similarity(sig, minhash.from_bytes(row.signature)), row.bug_id)
+                 for row in rows if row.bug_id != exclude_id),
+                reverse=True
+            )
+            scores = {bug_id: score for score, bug_id in scored[:limit] if score >= threshold}
+            if not scores:
+                return []
+            bugs = [self._convert_to_bug(model) for model in
+                    session.query(BugModel).filter(BugModel.id.in_(list(scores)))]
+            return sorted(((bug, scores[bug.id]) for bug in bugs),
+                          key=lambda pair: pair[1], reverse=True)
+
+    def rebuild_duplicate_index(self):
+        """Recompute the MinHash signatures and LSH buckets of every bug"""
+        with self.engine.begin() as connection:
+            self._rebuild_duplicate_index(connection)
+
+    def rebuild_trends(self):
+        """Regenerate the per-period creation counts from the bugs table"""
+        with self.engine.begin() as connection:
+            self._rebuild_trends(connection)
+            self._bump_change_version(connection)
+
+    def rebuild_search_index(self):
+        """Regenerate the full-text index from the bugs table"""
+        with self.engine.begin() as connection:
+            self._rebuild_search_index(connection)
+
+    def get_events(self, after_id: int = 0, limit: Optional[int] = 1000,
+                   bug_id: Optional[str] = None) -> List[BugEvent]:
+        """Change feed entries with an id above after_id, oldest first"""
+        with self._session_scope() as session:
+            query = session.query(BugEventModel).filter(BugEventModel.id > after_id)
+            if bug_id is not None:
+                query = query.filter(BugEventModel.bug_id == bug_id)
+            return [self._convert_to_event(model)
+                    for model in query.order_by(BugEventModel.id).limit(limit)]
 
     def delete_bug(self, bug_id: str) -> bool:
-        bug_model = self.session.query(BugModel).filter_by(id=bug_id).first()
-        if bug_model:
-            self.session.delete(bug_model)
-            self.session.commit()
-            return True
-        return False
+        with self._session_scope(write=True) as session:
+            bug_model = session.query(BugModel).filter_by(id=bug_id).first()
+            if bug_model:
+                session.delete(bug_model)
+                return True
+            return False
+
+    def _bump_change_version(self, connection):
+        connection.execute(_BUMP_CHANGE_VERSION)
+
+    def _get_stored_statistics(self, session) -> Dict:
+        distributions = {'status': Counter(), 'severity': Counter(), 'priority': Counter()}
+        enums = {'status': Status, 'severity': Severity, 'priority': Priority}
+        rows = session.query(BugStatModel).filter(
+            BugStatModel.dimension.in_(list(distributions)), BugStatModel.count > 0,
+            BugStatModel.value.isnot(None)
+        )
+        for row in rows:
+            distributions[row.dimension][enums[row.dimension][row.value].value] = row.count
+
+        status_distribution = distributions['status']
+        return {
+            'status_distribution': status_distribution,
+            'severity_distribution': distributions['severity'],
+            'priority_distribution': distributions['priority'],
+            'total_bugs': sum(status_distribution.values()),
+            'open_bugs': status_distribution[Status.OPEN.value],
+            'resolved_bugs': status_distribution[Status.RESOLVED.value]
+        }
+
+    def _compute_bug_stats(self, connection) -> Dict[Tuple[str, str], int]:
+        counts = {}
+        for dimension, expression in _STATS_DIMENSIONS.items():
+            rows = connection.execute(text(
+                f"SELECT {expression}, COUNT(*) FROM bugs "
+                f"WHERE {expression} IS NOT NULL GROUP BY {expression}"
+            ))
+            counts.update({(dimension, value): count for value, count in rows})
+        return counts
+
+    def _bug_stats_drift(self, connection) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        actual = self._compute_bug_stats(connection)
+        stored = {
+            (dimension, value): count
+            for dimension, value, count in connection.execute(
+                text("SELECT dimension, value, count FROM bug_stats WHERE count != 0"))
+        }
+        return {
+            key: (stored.get(key, 0), actual.get(key, 0))
+            for key in stored.keys() | actual.keys()
+            if stored.get(key, 0) != actual.get(key, 0)
+        }
+
+    def _rebuild_bug_stats(self, connection):
+        connection.execute(text("DELETE FROM bug_stats"))
+        for dimension, expression in _STATS_DIMENSIONS.items():
+            connection.execute(text(
+                f"INSERT INTO bug_stats (dimension, value, count) "
+                f"SELECT '{dimension}', {expression}, COUNT(*) FROM bugs "
+                f"WHERE {expression} IS NOT NULL GROUP BY {expression}"
+            ))
+
+    def _period_start(self, granularity: str, day: date) -> str:
+        if granularity == 'week':
+            day -= timedelta(days=day.weekday())
+        elif granularity == 'month':
+            day = day.replace(day=1)
+        return day.isoformat()
+
+    def _rebuild_trends(self, connection):
+        connection.execute(text("DELETE FROM bug_trends"))
+        for granularity, period in _TREND_PERIODS.items():
+            expression = period.format('created_at')
+            connection.execute(text(
+                f"INSERT INTO bug_trends (granularity, period, status, severity, priority, count) "
+                f"SELECT '{granularity}', {expression}, status, severity, priority, COUNT(*) "
+                f"FROM bugs AS bug WHERE {_TREND_ROW_COMPLETE.format('bug')} "
+                f"GROUP BY {expression}, status, severity, priority"
+            ))
+
+    def _rebuild_search_index(self, connection):
+        connection.execute(text(
+            "DELETE FROM bug_search_ids WHERE bug_id NOT IN (SELECT id FROM bugs)"))
+        connection.execute(text(
+            "INSERT INTO bug_search_ids (bug_id) SELECT id FROM bugs "
+            "WHERE id NOT IN (SELECT bug_id FROM bug_search_ids) ORDER BY rowid"))
+        connection.execute(text("INSERT INTO bugs_fts (bugs_fts) VALUES ('rebuild')"))
+
+    def _index_duplicates(self, connection, rows: List[dict]):
+        """Store signatures and band buckets for rows of the bugs table"""
+        signatures, buckets = [], []
+        for row in rows:
+            sig = minhash.signature(minhash.duplicate_text(
+                row['title'], row['description'], row['actual_result']))
+            if sig is None:
+                continue
+            signatures.append({'bug_id': row['id'], 'signature': minhash.to_bytes(sig)})
+            buckets.extend(
+                {'band': band, 'bucket': bucket, 'bug_id': row['id']}
+                for band, bucket in enumerate(minhash.band_buckets(sig))
+            )
+        if signatures:
+            connection.execute(insert(BugSignatureModel.__table__), signatures)
+            connection.execute(insert(BugLshBucketModel.__table__), buckets)
+
+    def _unindex_duplicates(self, connection, bug_id: str):
+        connection.execute(BugLshBucketModel.__table__.delete().where(
+            BugLshBucketModel.bug_id == bug_id))
+        connection.execute(BugSignatureModel.__table__.delete().where(
+            BugSignatureModel.bug_id == bug_id))
+
+    def _rebuild_duplicate_index(self, connection, batch_size: int = 1000):
+        connection.execute(BugLshBucketModel.__table__.delete())
+        connection.execute(BugSignatureModel.__table__.delete())
+        bugs = BugModel.__table__
+        columns = [bugs.c.id, bugs.c.title, bugs.c.description, bugs.c.actual_result]
+        last_id = None
+        while True:
+            query = select(*columns).order_by(bugs.c.id).limit(batch_size)
+            if last_id is not None:
+                query = query.where(bugs.c.id > last_id)
+            batch = [dict(row._mapping) for row in connection.execute(query)]
+            if not batch:
+                return
+            self._index_duplicates(connection, batch)
+            last_id = batch[-1]['id']
+
+    def _count_by(self, session, column, **filters) -> Counter:
+        query = self._apply_filters(
+            session.query(column, func.count()), **filters
+        ).group_by(column)
+        return Counter({
+            value.value: count for value, count in query if value is not None
+        })
+
+    def _apply_filters(self, query, status_filter: List[str] = None,
+                       severity_filter: List[str] = None,
+                       priority_filter: List[str] = None,
+                       start_date: Optional[date] = None,
+                       end_date: Optional[date] = None):
+        """Compile the list-page filters into WHERE clauses on the bugs table"""
+        if status_filter:
+            query = query.filter(
+                BugModel.status.in_([Status(value) for value in status_filter]))
+        if severity_filter:
+            query = query.filter(
+                BugModel.severity.in_([Severity(value) for value in severity_filter]))
+        if priority_filter:
+            query = query.filter(
+                BugModel.priority.in_([Priority(value) for value in priority_filter]))
+        # Dates are inclusive on both ends, matching created_at.date() comparisons
+        if start_date:
+            query = query.filter(
+                BugModel.created_at >= datetime.combine(start_date, time.min))
+        if end_date:
+            query = query.filter(
+                BugModel.created_at < datetime.combine(end_date + timedelta(days=1), time.min))
+        return query
+
+    def _column_frame(self, batch: Dict[str, tuple]) -> pd.DataFrame:
+        data = {}
+        for name, values in batch.items():
+            if name in _ENUM_COLUMNS:
+                members = list(_ENUM_COLUMNS[name])
+                data[name] = pd.Categorical(
+                    values, categories=[member.name for member in members]
+                ).rename_categories([member.value for member in members])
+            elif name in _DATETIME_COLUMNS:
+                data[name] = pd.to_datetime(pd.Series(values, dtype=object))
+            else:
+                data[name] = pd.Series(values, dtype=object)
+        return pd.DataFrame(data)
+
+    def _bug_to_row(self, bug: Bug) -> dict:
+        return {
+            'id': bug.id,
+            'title': bug.title,
+            'description': bug.description,
+            'severity': bug.severity,
+            'priority': bug.priority,
+            'status': bug.status,
+            'assigned_to': bug.assigned_to,
+            'created_by': bug.created_by,
+            'created_at': bug.created_at,
+            'updated_at': bug.updated_at,
+            'steps_to_reproduce': bug.steps_to_reproduce,
+            'expected_result': bug.expected_result,
+            'actual_result': bug.actual_result,
+            'version': bug.version
+        }
 
     def _convert_to_bug(self, bug_model: BugModel) -> Bug:
         return Bug(
@@ -92,11 +1212,35 @@ class DatabaseManager:
             severity=bug_model.severity,
             priority=bug_model.priority,
             status=bug_model.status,
-            assigned_to=bug_model.assigned_to,
-            created_by=bug_model.created_by,
+            assigned_to=_intern(bug_model.assigned_to),
+            created_by=_intern(bug_model.created_by),
             created_at=bug_model.created_at,
             updated_at=bug_model.updated_at,
             steps_to_reproduce=bug_model.steps_to_reproduce,
             expected_result=bug_model.expected_result,
-            actual_result=bug_model.actual_result
-        )
\ No newline at end of file
+            actual_result=bug_model.actual_result,
+            version=bug_model.version
+        )
+
+    def _convert_to_event(self, event_model: BugEventModel) -> BugEvent:
+        changes = {
+            name: (self._decode_event_value(name, old), self._decode_event_value(name, new))
+            for name, (old, new) in json.loads(event_model.changes).items()
+        }
+        return BugEvent(
+            id=event_model.id,
+            bug_id=event_model.bug_id,
+            event_type=event_model.event_type,
+            changes=changes,
+            occurred_at=event_model.occurred_at
+        )
+
+    def _decode_event_value(self, name: str, value):
+        """Turn a stored value from the feed back into the Bug field's type"""
+        if value is None:
+            return None
+        if name in _ENUM_COLUMNS:
+            return _ENUM_COLUMNS[name][value]
+        if name in _DATETIME_COLUMNS:
+            return datetime.fromisoformat(value)
+        return value
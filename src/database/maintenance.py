@@ -0,0 +1,55 @@
+# src/database/maintenance.py
+import argparse
+import sys
+from .db_manager import DatabaseManager
+
+def print_drift(drift: dict):
+    for (dimension, value), (stored, actual) in sorted(drift.items()):
+        print(f"  {dimension}={value}: stored {stored}, actual {actual}")
+
+def verify_stats(db_manager: DatabaseManager) -> int:
+    drift = db_manager.verify_bug_stats()
+    if not drift:
+        print("bug_stats is consistent with bugs")
+        return 0
+    print(f"bug_stats has drifted on {len(drift)} counters:")
+    print_drift(drift)
+    return 1
+
+def rebuild_stats(db_manager: DatabaseManager) -> int:
+    drift = db_manager.rebuild_bug_stats()
+    print(f"Rebuilt bug_stats, corrected {len(drift)} counters")
+    print_drift(drift)
+    return 0
+
+def rebuild_search(db_manager: DatabaseManager) -> int:
+    db_manager.rebuild_search_index()
+    print("Rebuilt the bugs_fts search index")
+    return 0
+
+def rebuild_duplicates(db_manager: DatabaseManager) -> int:
+    db_manager.rebuild_duplicate_index()
+    print("Rebuilt the duplicate detection index")
+    return 0
+
+def rebuild_trends(db_manager: DatabaseManager) -> int:
+    db_manager.rebuild_trends()
+    print("Rebuilt the bug_trends rollup")
+    return 0
+
+COMMANDS = {
+    'verify-stats': verify_stats,
+    'rebuild-stats': rebuild_stats,
+    'rebuild-search': rebuild_search,
+    'rebuild-duplicates': rebuild_duplicates,
+    'rebuild-trends': rebuild_trends,
+}
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Bug tracker database maintenance")
+    parser.add_argument('command', choices=sorted(COMMANDS))
+    args = parser.parse_args(argv)
+    return COMMANDS[args.command](DatabaseManager())
+
+if __name__ == "__main__":
+    sys.exit(main())
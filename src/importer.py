@@ -0,0 +1,216 @@
+# src/importer.py
+"""Stream bugs exported from other trackers into the database.
+
+Usage: python -m src.importer bugs.csv [--format csv|jsonl] [--batch-size N]
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from sqlalchemy.exc import IntegrityError
+from .database.db_manager import DatabaseManager
+from .models.bug import Bug, Status, Severity, Priority
+
+FORMATS = {
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+}
+
+MAX_REPORTED_ERRORS = 10
+
+@dataclass
+class ImportStats:
+    accepted: int = 0
+    rejected: int = 0
+    errors: List[str] = field(default_factory=list)
+    started_at: float = field(default_factory=time.monotonic)
+
+    def reject(self, line_number: int, reason: str):
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(f"line {line_number}: {reason}")
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = time.monotonic() - self.started_at
+        return (self.accepted + self.rejected) / elapsed if elapsed > 0 else 0.0
+
+def _enum_lookup(enum_cls) -> Dict[str, object]:
+    """Accept either the member name or its display value, case-insensitively"""
+    lookup = {}
+    for member in enum_cls:
+        lookup[member.name.lower()] = member
+        lookup[member.value.lower()] = member
+    return lookup
+
+SEVERITIES = _enum_lookup(Severity)
+PRIORITIES = _enum_lookup(Priority)
+STATUSES = _enum_lookup(Status)
+
+def read_csv(path: str) -> Iterator[tuple]:
+    """Yield (line_number, record) pairs from a CSV file with a header row"""
+    # utf-8-sig drops the byte order mark spreadsheet exports start with
+    with open(path, newline='', encoding='utf-8-sig') as file:
+        reader = csv.DictReader(file)
+        for record in reader:
+            yield reader.line_num, record
+
+def read_jsonl(path: str) -> Iterator[tuple]:
+    """Yield (line_number, record) pairs from a JSON Lines file"""
+    with open(path, encoding='utf-8-sig') as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, ValueError(f"invalid JSON: {e.msg}")
+
+READERS = {
+    'csv': read_csv,
+    'jsonl': read_jsonl,
+}
+
+def _parse_enum(lookup: Dict[str, object], record: dict, key: str, default=None):
+    raw = record.get(key)
+    if raw is None or str(raw).strip() == '':
+        if default is None:
+            raise ValueError(f"missing {key}")
+        return default
+    try:
+        return lookup[str(raw).strip().lower()]
+    except KeyError:
+        raise ValueError(f"invalid {key}: {raw!r}")
+
+def _parse_datetime(record: dict, key: str, default: datetime) -> datetime:
+    raw = record.get(key)
+    if raw is None or str(raw).strip() == '':
+        return default
+    try:
+        value = datetime.fromisoformat(str(raw).strip())
+    except ValueError:
+        raise ValueError(f"invalid {key}: {raw!r}")
+    # Timestamps are stored as naive local time
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return value
+
+def _text(record: dict, key: str) -> str:
+    value = record.get(key)
+    return '' if value is None else str(value)
+
+def parse_bug(record: dict) -> Bug:
+    """Map one exported record to a Bug, raising ValueError if it is invalid"""
+    if not isinstance(record, dict):
+        raise ValueError("record is not an object")
+    title = _text(record, 'title').strip()
+    if not title:
+        raise ValueError("missing title")
+
+    created_at = _parse_datetime(record, 'created_at', datetime.now())
+    return Bug(
+        id=_text(record, 'id').strip() or str(uuid.uuid4()),
+        title=title,
+        description=_text(record, 'description'),
+        severity=_parse_enum(SEVERITIES, record, 'severity'),
+        priority=_parse_enum(PRIORITIES, record, 'priority'),
+        status=_parse_enum(STATUSES, record, 'status', Status.OPEN),
+        assigned_to=_text(record, 'assigned_to'),
+        created_by=_text(record, 'created_by'),
+        created_at=created_at,
+        updated_at=_parse_datetime(record, 'updated_at', created_at),
+        steps_to_reproduce=_text(record, 'steps_to_reproduce'),
+        expected_result=_text(record, 'expected_result'),
+        actual_result=_text(record, 'actual_result')
+    )
+
+def validate(records: Iterable[tuple], stats: ImportStats) -> Iterator[Tuple[int, Bug]]:
+    """Yield (line_number, bug) for valid records, counting and skipping rejected ones"""
+    for line_number, record in records:
+        try:
+            if isinstance(record, Exception):
+                raise record
+            bug = parse_bug(record)
+        except ValueError as e:
+            stats.reject(line_number, str(e))
+            continue
+        yield line_number, bug
+
+def save(bugs: Iterable[Tuple[int, Bug]], db_manager: DatabaseManager, stats: ImportStats,
+         batch_size: int, progress_every: int):
+    """Insert bugs a batch at a time, rejecting those whose id is already taken"""
+    bugs = iter(bugs)
+    reported = 0
+    while True:
+        batch = list(islice(bugs, batch_size))
+        if not batch:
+            return
+        try:
+            db_manager.save_bugs((bug for _, bug in batch), batch_size)
+            stats.accepted += len(batch)
+        except IntegrityError:
+            # The batch was rolled back; save its bugs one at a time to find the collisions
+            for line_number, bug in batch:
+                try:
+                    db_manager.save_bugs([bug])
+                    stats.accepted += 1
+                except IntegrityError:
+                    stats.reject(line_number, f"duplicate id: {bug.id!r}")
+
+        processed = stats.accepted + stats.rejected
+        if processed // progress_every > reported:
+            reported = processed // progress_every
+            print(f"{stats.accepted} accepted, {stats.rejected} rejected "
+                  f"({stats.rows_per_second:,.0f} rows/sec)", file=sys.stderr)
+
+def import_file(path: str, db_manager: DatabaseManager, file_format: Optional[str] = None,
+                batch_size: int = 1000, progress_every: int = 10000) -> ImportStats:
+    """Stream a CSV or JSONL export into the database in batches"""
+    if file_format is None:
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in FORMATS:
+            raise ValueError(f"Cannot infer format from {path}, pass --format")
+        file_format = FORMATS[extension]
+    if batch_size < 1:
+        raise ValueError("--batch-size must be at least 1")
+    if progress_every < 1:
+        raise ValueError("--progress-every must be at least 1")
+
+    stats = ImportStats()
+    try:
+        save(validate(READERS[file_format](path), stats), db_manager, stats,
+             batch_size, progress_every)
+    except UnicodeDecodeError as e:
+        raise ValueError(f"{path} is not valid UTF-8 ({e.reason}); "
+                         f"stopped after importing {stats.accepted} bugs")
+    return stats
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Import bugs from a CSV or JSONL export")
+    parser.add_argument('path')
+    parser.add_argument('--format', choices=sorted(READERS), dest='file_format')
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--progress-every', type=int, default=10000)
+    args = parser.parse_args(argv)
+
+    try:
+        stats = import_file(args.path, DatabaseManager(), args.file_format,
+                            args.batch_size, args.progress_every)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"Imported {stats.accepted} bugs, rejected {stats.rejected} "
+          f"({stats.rows_per_second:,.0f} rows/sec)")
+    for error in stats.errors:
+        print(f"  {error}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from typing import Any, Dict, NamedTuple, Tuple
 
 class Severity(Enum):
     LOW = "Low"
@@ -20,7 +21,12 @@ class Status(Enum):
     RESOLVED = "Resolved"
     CLOSED = "Closed"
 
-@dataclass
+class BugEventType(Enum):
+    CREATED = "Created"
+    UPDATED = "Updated"
+    DELETED = "Deleted"
+
+@dataclass(slots=True)
 class Bug:
     id: str
     title: str
@@ -35,4 +41,48 @@ class Bug:
     steps_to_reproduce: str
     expected_result: str
     actual_result: str
-    
\ No newline at end of file
+    # Incremented on every update; the token for optimistic concurrency
+    version: int = 1
+
+class BugRow(NamedTuple):
+    """Read-only bug as a plain tuple, for bulk reads that never modify bugs"""
+    id: str
+    title: str
+    description: str
+    severity: Severity
+    priority: Priority
+    status: Status
+    assigned_to: str
+    created_by: str
+    created_at: datetime
+    updated_at: datetime
+    steps_to_reproduce: str
+    expected_result: str
+    actual_result: str
+    version: int = 1
+
+@dataclass(slots=True)
+class BugSummary:
+    """The columns list views show, leaving out the long text fields"""
+    id: str
+    title: str
+    severity: Severity
+    priority: Priority
+    status: Status
+    assigned_to: str
+    created_at: datetime
+
+@dataclass(slots=True)
+class SearchResult:
+    bug: BugSummary
+    rank: float
+    snippet: str
+
+@dataclass(slots=True)
+class BugEvent:
+    """One entry of the change feed; changes maps each field to (old, new)"""
+    id: int
+    bug_id: str
+    event_type: BugEventType
+    changes: Dict[str, Tuple[Any, Any]]
+    occurred_at: datetime
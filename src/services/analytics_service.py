@@ -1,11 +1,35 @@
 # src/services/analytics_service.py
 from collections import Counter
-from typing import List, Dict
+from datetime import date, timedelta
+from typing import List, Dict, Optional, Tuple
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
 from ..models.bug import Bug, Status, Severity, Priority
 
+FRAME_COLUMNS = ['status', 'severity', 'priority', 'created_at']
+
+# Period offsets; weeks start on Monday
+TREND_FREQUENCIES = {
+    'Daily': 'D',
+    'Weekly': 'W-MON',
+    'Monthly': 'MS',
+}
+
+# Rollup table granularity behind each trend frequency
+TREND_PERIODS = {
+    'Daily': 'day',
+    'Weekly': 'week',
+    'Monthly': 'month',
+}
+
 class AnalyticsService:
-    def get_bug_statistics(self, bugs: List[Bug]) -> Dict:
-        """Calculate bug statistics"""
+    def __init__(self, db_manager=None):
+        self.db_manager = db_manager
+
+    def get_bug_statistics(self, bugs: Optional[List[Bug]] = None) -> Dict:
+        """Calculate bug statistics, in the database when no bugs are given"""
+        if bugs is None:
+            return self.db_manager.get_bug_statistics()
         return {
             'status_distribution': self._get_status_distribution(bugs),
             'severity_distribution': self._get_severity_distribution(bugs),
@@ -15,6 +39,87 @@ class AnalyticsService:
             'resolved_bugs': len([bug for bug in bugs if bug.status == Status.RESOLVED])
         }
 
+    def get_priority_severity_matrix(self, bugs: Optional[List[Bug]] = None) -> Dict[Tuple[str, str], int]:
+        """Count bugs per (priority, severity) pair"""
+        if bugs is None:
+            return self.db_manager.get_priority_severity_counts()
+        return Counter((bug.priority.value, bug.severity.value) for bug in bugs)
+
+    def get_priority_severity_table(self, filters: dict = None) -> pd.DataFrame:
+        """Bug counts with priorities as rows and severities as columns, counted in SQL"""
+        counts = self.db_manager.get_priority_severity_counts(**(filters or {}))
+        return pd.DataFrame(
+            [[counts.get((priority.value, severity.value), 0) for severity in Severity]
+             for priority in Priority],
+            index=pd.Index([priority.value for priority in Priority], name='Priority'),
+            columns=pd.Index([severity.value for severity in Severity], name='Severity')
+        )
+
+    def get_bug_frame(self, filters: dict = None) -> pd.DataFrame:
+        """The columns the dashboard aggregates, with categorical enums"""
+        return self.db_manager.read_frame(FRAME_COLUMNS, **(filters or {}))
+
+    def get_frame_statistics(self, frame: pd.DataFrame) -> Dict:
+        """Same metrics as get_bug_statistics, computed with vectorized counts"""
+        status_distribution = self._value_counts(frame['status'])
+        return {
+            'status_distribution': status_distribution,
+            'severity_distribution': self._value_counts(frame['severity']),
+            'priority_distribution': self._value_counts(frame['priority']),
+            'total_bugs': len(frame),
+            'open_bugs': status_distribution[Status.OPEN.value],
+            'resolved_bugs': status_distribution[Status.RESOLVED.value]
+        }
+
+    def get_priority_severity_frame(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Bug counts with priorities as rows and severities as columns"""
+        return frame.groupby(['priority', 'severity']).size().unstack(fill_value=0)
+
+    def get_trend(self, granularity: str = 'Daily', start_date: Optional[date] = None,
+                  end_date: Optional[date] = None, filters: dict = None) -> pd.Series:
+        """Bugs created per period from the rollup table, including periods with none.
+
+        filters takes the status, severity and priority lists of the list page.
+        """
+        counts = self.db_manager.get_trend_counts(
+            TREND_PERIODS[granularity], start_date, end_date, **(filters or {}))
+        trend = pd.Series(counts, dtype='int64')
+        trend.index = pd.to_datetime(trend.index)
+        first = start_date or (trend.index.min() if counts else None)
+        last = end_date or (trend.index.max() if counts else None)
+        if first is None or last is None:
+            return trend
+        offset = to_offset(TREND_FREQUENCIES[granularity])
+        # Roll the first bound back to a period start, the keys the rollup uses
+        periods = pd.date_range(offset.rollback(pd.Timestamp(first)), pd.Timestamp(last),
+                                freq=offset)
+        return trend.reindex(periods, fill_value=0)
+
+    def get_resolution_time_stats(self, filters: dict = None) -> Dict:
+        """Mean, median and 90th percentile time from creation to resolution"""
+        times = self.db_manager.get_resolution_times(**(filters or {}))
+        stats = {'resolved_bugs': times['count']}
+        for name in ('mean', 'median', 'p90'):
+            seconds = times[name]
+            stats[name] = None if seconds is None else timedelta(seconds=round(seconds))
+        return stats
+
+    def get_open_bug_age_histogram(self, filters: dict = None) -> Dict[str, int]:
+        """Open and In Progress bugs per age bucket, youngest first"""
+        return self.db_manager.get_open_bug_ages(**(filters or {}))
+
+    def get_weekly_flow(self, start_date: Optional[date] = None,
+                        end_date: Optional[date] = None) -> pd.DataFrame:
+        """Bugs opened and resolved per week, with the running change in open bugs"""
+        return pd.DataFrame(
+            self.db_manager.get_weekly_flow(start_date, end_date),
+            columns=['Week', 'Opened', 'Resolved', 'Net Change']
+        )
+
+    def _value_counts(self, values: pd.Series) -> Counter:
+        return Counter({value: int(count)
+                        for value, count in values.value_counts(sort=False).items() if count})
+
     def _get_status_distribution(self, bugs: List[Bug]) -> Dict:
         return Counter(bug.status.value for bug in bugs)
 
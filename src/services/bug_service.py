@@ -1,52 +1,101 @@
 # src/services/bug_service.py
-from datetime import datetime
-import uuid
+from datetime import date, datetime
+import base64
+import json
+import os
+import re
 import time
-from typing import List, Optional
-from ..models.bug import Bug, Status, Severity, Priority
+import uuid
+from dataclasses import fields, replace
+from typing import Iterable, Iterator, List, Optional, Tuple
+from ..models.bug import Bug, BugEvent, BugRow, BugSummary, SearchResult, Status, Severity, Priority
+from ..utils.lru_cache import CacheStats, LRUCache
+from ..utils.minhash import duplicate_text
+
+UPDATABLE_FIELDS = {field.name for field in fields(Bug)} - {'id', 'version'}
+
+SORT_ORDERS = {
+    'newest': True,
+    'oldest': False,
+}
 
 class BugService:
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, cache_size: Optional[int] = None,
+                 cache_ttl: Optional[float] = None, version_check_interval: Optional[float] = None):
         self.db_manager = db_manager
+        if cache_size is None:
+            cache_size = int(os.getenv('BUG_CACHE_SIZE', '1024'))
+        if cache_ttl is None:
+            cache_ttl = float(os.getenv('BUG_CACHE_TTL', '60'))
+        if version_check_interval is None:
+            version_check_interval = float(os.getenv('BUG_CACHE_CHECK_INTERVAL', '1'))
+        # Bugs read by id, dropped whenever the database change version moves
+        self._bug_cache: LRUCache[Bug] = LRUCache(cache_size, cache_ttl or None)
+        self._cache_version: Optional[int] = None
+        self._version_check_interval = version_check_interval
+        self._version_checked_at = float('-inf')
 
     def create_bug(self, bug_data: dict) -> Bug:
-        bug_id = str(uuid.uuid4())
-        current_time = datetime.now()
-        
-        bug = Bug(
-            id=bug_id,
-            title=bug_data['title'],
-            description=bug_data['description'],
-            severity=Severity[bug_data['severity']],
-            priority=Priority[bug_data['priority']],
-            status=Status.OPEN,
-            assigned_to=bug_data['assigned_to'],
-            created_by=bug_data['created_by'],
-            created_at=current_time,
-            updated_at=current_time,
-            steps_to_reproduce=bug_data['steps_to_reproduce'],
-            expected_result=bug_data['expected_result'],
-            actual_result=bug_data['actual_result']
-        )
-        
+        bug = self._build_bug(bug_data)
         return self.db_manager.save_bug(bug)
 
-    def get_bug(self, bug_id: str) -> Optional[Bug]:
-        """Retrieve a specific bug by ID"""
-        return self.db_manager.get_bug(bug_id)
-
-    def update_bug(self, bug_id: str, update_data: dict) -> Optional[Bug]:
-        bug = self.db_manager.get_bug(bug_id)
-        if not bug:
-            return None
-            
-        for key, value in update_data.items():
-            if hasattr(bug, key):
-                setattr(bug, key, value)
-        
-        time.sleep(0.001)  # Ensure time difference for updates
-        bug.updated_at = datetime.now()
-        return self.db_manager.update_bug(bug)
+    def create_bugs(self, bugs_data: Iterable[dict], batch_size: int = 1000) -> int:
+        """Create bugs in batches, returning how many were saved"""
+        bugs = (self._build_bug(bug_data) for bug_data in bugs_data)
+        return self.db_manager.save_bugs(bugs, batch_size)
+
+    def get_bug(self, bug_id: str, version: Optional[int] = None) -> Optional[Bug]:
+        """Retrieve a specific bug by ID.
+
+        A caller that has just read the change version, such as a page cache
+        keyed on it, passes it as version so no bug cached before it is returned.
+        """
+        self._check_cache_version(version)
+        bug = self._bug_cache.get(bug_id)
+        if bug is None:
+            bug = self.db_manager.get_bug(bug_id)
+            if bug is None:
+                return None
+            self._bug_cache.put(bug_id, bug)
+        # Callers may modify the bug they get, which must not change the cached one
+        return replace(bug)
+
+    def cache_stats(self) -> CacheStats:
+        """Hit, miss and eviction counts of the get_bug cache"""
+        return self._bug_cache.stats()
+
+    def _check_cache_version(self, version: Optional[int] = None):
+        """Drop cached bugs if another process wrote since, asking the database at most once per interval"""
+        now = time.monotonic()
+        if version is None:
+            if now - self._version_checked_at < self._version_check_interval:
+                return
+            version = self.db_manager.change_version
+        self._version_checked_at = now
+        if version != self._cache_version:
+            self._bug_cache.clear()
+            self._cache_version = version
+
+    def update_bug(self, bug_id: str, update_data: dict,
+                   expected_version: Optional[int] = None) -> Optional[Bug]:
+        """Update a bug, returning None if it does not exist or was changed concurrently"""
+        bug, _ = self.try_update_bug(bug_id, update_data, expected_version)
+        return bug
+
+    def try_update_bug(self, bug_id: str, update_data: dict,
+                       expected_version: Optional[int] = None) -> Tuple[Optional[Bug], bool]:
+        """Update only the given fields, returning (bug, conflict).
+
+        Pass the version of the bug the caller last saw as expected_version to
+        reject the update when someone else has modified the bug since.
+        """
+        changes = {key: value for key, value in update_data.items()
+                   if key in UPDATABLE_FIELDS}
+        changes['updated_at'] = datetime.now()
+        result = self.db_manager.update_bug_fields(bug_id, changes, expected_version)
+        # Dropped after the write so a concurrent read cannot re-cache the old bug
+        self._bug_cache.invalidate(bug_id)
+        return result
 
     def get_all_bugs(self) -> List[Bug]:
         """Retrieve all bugs"""
@@ -58,25 +107,124 @@ class BugService:
 
     def get_filtered_bugs(self, status_filter: List[str] = None, 
                          severity_filter: List[str] = None,
-                         priority_filter: List[str] = None) -> List[Bug]:
+                         priority_filter: List[str] = None,
+                         start_date: Optional[date] = None,
+                         end_date: Optional[date] = None) -> List[Bug]:
         """Retrieve bugs with specified filters"""
-        all_bugs = self.get_all_bugs()
-        filtered_bugs = all_bugs
+        return self.db_manager.get_filtered_bugs(
+            status_filter,
+            severity_filter,
+            priority_filter,
+            start_date,
+            end_date
+        )
+
+    def iter_bugs(self, filters: dict = None, batch_size: int = 1000) -> Iterator[Bug]:
+        """Stream bugs matching the filters without loading them all at once"""
+        return self.db_manager.iter_bugs(batch_size, **(filters or {}))
 
-        if status_filter:
-            filtered_bugs = [bug for bug in filtered_bugs 
-                           if bug.status.value in status_filter]
+    def iter_bug_rows(self, filters: dict = None, batch_size: int = 1000) -> Iterator[BugRow]:
+        """Stream bugs matching the filters as read-only tuples"""
+        return self.db_manager.iter_bug_rows(batch_size, **(filters or {}))
 
-        if severity_filter:
-            filtered_bugs = [bug for bug in filtered_bugs 
-                           if bug.severity.value in severity_filter]
+    def count_bugs(self, filters: dict = None) -> int:
+        """Number of bugs matching the filters"""
+        return self.db_manager.count_bugs(**(filters or {}))
 
-        if priority_filter:
-            filtered_bugs = [bug for bug in filtered_bugs 
-                           if bug.priority.value in priority_filter]
+    def get_statistics(self, filters: dict = None) -> dict:
+        """Counts per status, severity and priority of the bugs matching the filters"""
+        return self.db_manager.get_bug_statistics(**(filters or {}))
 
-        return filtered_bugs
+    def list_bugs(self, filters: dict = None, sort: str = 'newest',
+                  cursor: Optional[str] = None,
+                  limit: int = 50) -> Tuple[List[BugSummary], Optional[str]]:
+        """Retrieve one page of bug summaries and the cursor for the following page"""
+        if sort not in SORT_ORDERS:
+            raise ValueError(f"Unknown sort order: {sort}")
+
+        # Fetch one extra row to learn whether another page exists
+        bugs = self.db_manager.get_bugs_page(
+            after=self._decode_cursor(cursor) if cursor else None,
+            limit=limit + 1,
+            descending=SORT_ORDERS[sort],
+            **(filters or {})
+        )
+        if len(bugs) <= limit:
+            return bugs, None
+        bugs = bugs[:limit]
+        return bugs, self._encode_cursor(bugs[-1])
+
+    def get_bug_summaries(self, filters: dict = None,
+                          limit: Optional[int] = None) -> List[BugSummary]:
+        """Summaries of the bugs matching the filters, newest first"""
+        return self.db_manager.get_bug_summaries(limit, **(filters or {}))
+
+    def search(self, query: str, filters: dict = None, limit: int = 20) -> List[SearchResult]:
+        """Full-text search over bug titles, descriptions, steps and actual results"""
+        # Quote every word so FTS5 operators in user input are matched literally
+        terms = re.findall(r'\w+', query)
+        if not terms:
+            return []
+        fts_query = ' '.join(f'"{term}"' for term in terms)
+        return self.db_manager.search_bugs(fts_query, limit, **(filters or {}))
+
+    def find_duplicates(self, bug_data: dict, limit: int = 5,
+                        exclude_id: Optional[str] = None) -> List[Tuple[Bug, float]]:
+        """Likely duplicates of a bug report with their estimated similarity"""
+        text = duplicate_text(bug_data.get('title'), bug_data.get('description'),
+                              bug_data.get('actual_result'))
+        return self.db_manager.find_similar_bugs(text, limit, exclude_id=exclude_id)
+
+    def transition_bugs(self, status: Status, filters: dict = None) -> int:
+        """Move every bug matching the filters to a new status"""
+        updated = self.db_manager.update_status(status, **(filters or {}))
+        self._bug_cache.clear()
+        return updated
 
     def delete_bug(self, bug_id: str) -> bool:
         """Delete a bug by ID"""
-        return self.db_manager.delete_bug(bug_id)
\ No newline at end of file
+        deleted = self.db_manager.delete_bug(bug_id)
+        self._bug_cache.invalidate(bug_id)
+        return deleted
+
+    def changes_since(self, cursor: int = 0, limit: int = 1000) -> Tuple[List[BugEvent], int]:
+        """Creates, updates and deletes after cursor, oldest first, with the cursor to resume from.
+
+        Start from 0 to read the whole history; when there is nothing new the
+        same cursor comes back, so consumers can keep polling with it.
+        """
+        events = self.db_manager.get_events(cursor, limit)
+        return events, events[-1].id if events else cursor
+
+    def get_bug_history(self, bug_id: str) -> List[BugEvent]:
+        """Every recorded change to one bug, oldest first"""
+        return self.db_manager.get_events(limit=None, bug_id=bug_id)
+
+    def _build_bug(self, bug_data: dict) -> Bug:
+        current_time = datetime.now()
+        return Bug(
+            id=str(uuid.uuid4()),
+            title=bug_data['title'],
+            description=bug_data['description'],
+            severity=Severity[bug_data['severity']],
+            priority=Priority[bug_data['priority']],
+            status=Status.OPEN,
+            assigned_to=bug_data['assigned_to'],
+            created_by=bug_data['created_by'],
+            created_at=current_time,
+            updated_at=current_time,
+            steps_to_reproduce=bug_data['steps_to_reproduce'],
+            expected_result=bug_data['expected_result'],
+            actual_result=bug_data['actual_result']
+        )
+
+    def _encode_cursor(self, bug: BugSummary) -> str:
+        payload = json.dumps([bug.created_at.isoformat(), bug.id])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def _decode_cursor(self, cursor: str) -> Tuple[datetime, str]:
+        try:
+            created_at, bug_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return datetime.fromisoformat(created_at), bug_id
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
\ No newline at end of file
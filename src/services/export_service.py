@@ -0,0 +1,118 @@
+# src/services/export_service.py
+"""Columnar bug exports for notebooks: CSV, Parquet and Arrow IPC.
+
+Rows are read from the database in batches of stored values and decoded a
+column at a time into Arrow arrays; status, severity and priority become
+dictionary-encoded columns sharing one fixed dictionary per enum, which
+pandas reads back as categoricals.
+"""
+from typing import Callable, Iterator, Optional
+import os
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.ipc as pa_ipc
+import pyarrow.parquet as pq
+from ..models.bug import Status, Severity, Priority
+
+EXPORT_FORMATS = {
+    'CSV': 'csv',
+    'Parquet': 'parquet',
+    'Arrow': 'arrow',
+}
+
+ENUM_COLUMNS = {
+    'severity': Severity,
+    'priority': Priority,
+    'status': Status,
+}
+
+TIMESTAMP_COLUMNS = {'created_at', 'updated_at'}
+
+ENUM_TYPE = pa.dictionary(pa.int8(), pa.string())
+
+SCHEMA = pa.schema([
+    ('id', pa.string()),
+    ('title', pa.string()),
+    ('description', pa.string()),
+    ('severity', ENUM_TYPE),
+    ('priority', ENUM_TYPE),
+    ('status', ENUM_TYPE),
+    ('assigned_to', pa.string()),
+    ('created_by', pa.string()),
+    ('created_at', pa.timestamp('us')),
+    ('updated_at', pa.timestamp('us')),
+    ('steps_to_reproduce', pa.string()),
+    ('expected_result', pa.string()),
+    ('actual_result', pa.string()),
+])
+
+def _enum_array(values: tuple, enum_cls) -> pa.DictionaryArray:
+    """Map stored member names onto a dictionary of display values"""
+    indices = pc.index_in(pa.array(values, pa.string()),
+                          value_set=pa.array([member.name for member in enum_cls]))
+    return pa.DictionaryArray.from_arrays(
+        indices.cast(pa.int8()), pa.array([member.value for member in enum_cls]))
+
+class ExportService:
+    def __init__(self, db_manager, batch_size: int = 50000):
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+        self.reports_dir = os.path.join(os.getcwd(), 'reports')
+        os.makedirs(self.reports_dir, exist_ok=True)
+
+    def record_batches(self, filters: dict = None) -> Iterator[pa.RecordBatch]:
+        """Stream the bugs matching the filters as Arrow record batches"""
+        for batch in self.db_manager.iter_column_batches(self.batch_size, **(filters or {})):
+            yield pa.RecordBatch.from_arrays(
+                [self._column(field.name, batch[field.name]) for field in SCHEMA],
+                schema=SCHEMA)
+
+    def export(self, export_format: str, filename: str, filters: dict = None,
+               progress: Optional[Callable[[int], None]] = None) -> str:
+        """Write bugs in one of EXPORT_FORMATS, returning the file path"""
+        writers = {
+            'CSV': self.export_csv,
+            'Parquet': self.export_parquet,
+            'Arrow': self.export_arrow,
+        }
+        return writers[export_format](filename, filters, progress)
+
+    def export_csv(self, filename: str, filters: dict = None,
+                   progress: Optional[Callable[[int], None]] = None) -> str:
+        """Stream bugs into a CSV file with a header row"""
+        filepath = os.path.join(self.reports_dir, f"{filename}.csv")
+        with pa_csv.CSVWriter(filepath, SCHEMA) as writer:
+            self._write(writer, filters, progress)
+        return filepath
+
+    def export_parquet(self, filename: str, filters: dict = None,
+                       progress: Optional[Callable[[int], None]] = None) -> str:
+        """Write bugs to a Parquet file, one row group per batch"""
+        filepath = os.path.join(self.reports_dir, f"{filename}.parquet")
+        with pq.ParquetWriter(filepath, SCHEMA, compression='zstd') as writer:
+            self._write(writer, filters, progress)
+        return filepath
+
+    def export_arrow(self, filename: str, filters: dict = None,
+                     progress: Optional[Callable[[int], None]] = None) -> str:
+        """Write bugs to an Arrow IPC file readable with pyarrow.ipc.open_file"""
+        filepath = os.path.join(self.reports_dir, f"{filename}.arrow")
+        with pa_ipc.new_file(filepath, SCHEMA) as writer:
+            self._write(writer, filters, progress)
+        return filepath
+
+    def _write(self, writer, filters: Optional[dict],
+               progress: Optional[Callable[[int], None]]):
+        for batch in self.record_batches(filters):
+            writer.write_batch(batch)
+            if progress is not None:
+                progress(batch.num_rows)
+
+    def _column(self, name: str, values: tuple) -> pa.Array:
+        if name in ENUM_COLUMNS:
+            return _enum_array(values, ENUM_COLUMNS[name])
+        if name in TIMESTAMP_COLUMNS:
+            # SQLite stores timestamps as ISO text, which Arrow parses natively
+            return pa.array(values, pa.string()).cast(pa.timestamp('us'))
+        return pa.array(values, pa.string())
@@ -0,0 +1,176 @@
+# src/services/report_job_service.py
+"""Build reports on a worker pool so the Streamlit script thread stays responsive.
+
+Each report is keyed by a hash of its format, filters and the database
+change version, so repeating a request before the data changes returns
+the file that is already built instead of generating it again.
+"""
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Iterable, Iterator, Optional
+import hashlib
+import json
+import os
+import threading
+import uuid
+from .export_service import EXPORT_FORMATS
+from .report_service import PDF_ROWS_PER_PART
+from ..models.bug import BugRow
+
+REPORT_FORMATS = {
+    'Excel': 'xlsx',
+    'PDF': 'pdf',
+    **EXPORT_FORMATS,
+}
+
+class JobStatus(Enum):
+    QUEUED = "Queued"
+    RUNNING = "Running"
+    DONE = "Done"
+    FAILED = "Failed"
+
+@dataclass
+class ReportJob:
+    id: str
+    report_format: str
+    filters: dict
+    key: str
+    status: JobStatus = JobStatus.QUEUED
+    rows_written: int = 0
+    total_rows: int = 0
+    filepath: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def progress(self) -> float:
+        """Fraction of rows written, between 0 and 1"""
+        if self.status == JobStatus.DONE:
+            return 1.0
+        return min(self.rows_written / self.total_rows, 1.0) if self.total_rows else 0.0
+
+class ReportJobService:
+    def __init__(self, bug_service, report_service, export_service,
+                 max_workers: int = 2, max_results: int = 32):
+        self.bug_service = bug_service
+        self.report_service = report_service
+        self.export_service = export_service
+        self.max_results = max_results
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix='report-job')
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, ReportJob] = {}
+        self._futures: Dict[str, Future] = {}
+        # Finished jobs by content key, oldest first, so old files can be removed
+        self._results: 'OrderedDict[str, ReportJob]' = OrderedDict()
+        # Failed jobs by id, oldest first, kept only so their errors can be read
+        self._failures: 'OrderedDict[str, ReportJob]' = OrderedDict()
+        self._pending: Dict[str, ReportJob] = {}
+
+    def submit(self, report_format: str, filters: dict = None) -> str:
+        """Queue a report, returning the id of a job that builds or already built it"""
+        if report_format not in REPORT_FORMATS:
+            raise ValueError(f"Unknown report format: {report_format}")
+        filters = filters or {}
+        key = self._content_key(report_format, filters)
+
+        with self._lock:
+            job = self._results.get(key)
+            if job is not None and os.path.exists(job.filepath):
+                self._results.move_to_end(key)
+                return job.id
+            if key in self._pending:
+                return self._pending[key].id
+
+            job = ReportJob(str(uuid.uuid4()), report_format, filters, key)
+            self._jobs[job.id] = job
+            self._pending[key] = job
+            self._futures[job.id] = self._executor.submit(self._run, job)
+            return job.id
+
+    def get_job(self, job_id: str) -> Optional[ReportJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> ReportJob:
+        """Block until the job has finished, successfully or not"""
+        with self._lock:
+            future = self._futures.get(job_id)
+            job = self._jobs[job_id]
+        if future is not None:
+            future.result(timeout)
+        return job
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+    def _run(self, job: ReportJob):
+        job.status = JobStatus.RUNNING
+        try:
+            statistics = self.bug_service.get_statistics(job.filters)
+            job.total_rows = statistics['total_bugs']
+            filename = f"report-{job.key[:16]}"
+            if job.report_format in EXPORT_FORMATS:
+                job.filepath = self.export_service.export(
+                    job.report_format, filename, job.filters, self._progress(job))
+            elif job.report_format == 'Excel':
+                job.filepath = self.report_service.generate_excel_report(
+                    self._track(job, self.bug_service.iter_bug_rows(job.filters)), filename)
+            else:
+                job.filepath = self.report_service.generate_pdf_report(
+                    self._track(job, self.bug_service.iter_bug_rows(job.filters)), filename,
+                    statistics, rows_per_part=PDF_ROWS_PER_PART)
+        except Exception as e:
+            job.error = str(e)
+            job.status = JobStatus.FAILED
+            with self._lock:
+                self._pending.pop(job.key, None)
+                # wait() only needs the future while the job is running
+                self._futures.pop(job.id, None)
+                self._failures[job.id] = job
+                self._evict_failures()
+            return
+        job.status = JobStatus.DONE
+        with self._lock:
+            self._pending.pop(job.key, None)
+            self._futures.pop(job.id, None)
+            replaced = self._results.pop(job.key, None)
+            if replaced is not None:
+                self._jobs.pop(replaced.id, None)
+            self._results[job.key] = job
+            self._evict_results()
+
+    def _track(self, job: ReportJob, bugs: Iterable[BugRow]) -> Iterator[BugRow]:
+        for bug in bugs:
+            yield bug
+            job.rows_written += 1
+
+    def _progress(self, job: ReportJob):
+        def advance(rows: int):
+            job.rows_written += rows
+        return advance
+
+    def _evict_results(self):
+        while len(self._results) > self.max_results:
+            _, job = self._results.popitem(last=False)
+            self._jobs.pop(job.id, None)
+            if job.filepath and os.path.exists(job.filepath):
+                os.remove(job.filepath)
+
+    def _evict_failures(self):
+        while len(self._failures) > self.max_results:
+            job_id, _ = self._failures.popitem(last=False)
+            self._jobs.pop(job_id, None)
+
+    def _content_key(self, report_format: str, filters: dict) -> str:
+        """Hash of everything that determines the report's content"""
+        normalized = {
+            name: sorted(value) if isinstance(value, (list, tuple, set)) else value
+            for name, value in filters.items() if value
+        }
+        payload = json.dumps({
+            'format': report_format,
+            'filters': normalized,
+            'version': self.bug_service.db_manager.change_version
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
@@ -1,8 +1,126 @@
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from fpdf import FPDF
-from typing import List
+from itertools import chain, islice
+from openpyxl import Workbook
+from pypdf import PdfWriter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from .analytics_service import AnalyticsService
 from ..models.bug import Bug
+import multiprocessing
 import os
+import tempfile
+
+EXCEL_COLUMNS = [
+    'ID', 'Title', 'Status', 'Severity', 'Priority', 'Assigned To', 'Created At',
+    'Description', 'Steps to Reproduce', 'Expected Result', 'Actual Result'
+]
+
+# (heading, width in mm) for the landscape A4 table, 277 mm between the margins
+PDF_COLUMNS = [
+    ('ID', 24),
+    ('Title', 106),
+    ('Status', 24),
+    ('Severity', 20),
+    ('Priority', 18),
+    ('Assigned To', 49),
+    ('Created At', 36)
+]
+PDF_ROW_HEIGHT = 5
+PDF_ROWS_PER_PART = 5000
+
+class _TablePDF(FPDF):
+    """Landscape PDF that repeats the column headings on every page"""
+
+    def __init__(self):
+        super().__init__(orientation='L', format='A4')
+        self.set_auto_page_break(True, margin=10)
+        self.set_margins(10, 10)
+        # Set while the first page still has to draw the summary above the table
+        self.summary_pending = False
+
+    def header(self):
+        if not self.summary_pending:
+            self.table_header()
+
+    def table_header(self):
+        self.set_font('Arial', 'B', 8)
+        self.set_fill_color(230, 230, 230)
+        for heading, width in PDF_COLUMNS:
+            self.cell(width, PDF_ROW_HEIGHT + 1, heading, 1, 0, 'L', True)
+        self.ln()
+        self.set_font('Arial', '', 8)
+
+def _latin1(text: str) -> str:
+    # The core fonts of fpdf 1.7 only cover Latin-1
+    return text.encode('latin-1', 'replace').decode('latin-1')
+
+def _fit(pdf: FPDF, text: str, width: float) -> str:
+    """Truncate text with an ellipsis so it fits in a cell of the given width"""
+    text = _latin1(' '.join(text.split()))
+    available = width - 2 * pdf.c_margin
+    if pdf.get_string_width(text) <= available:
+        return text
+    # Start from a length estimate based on the average glyph width, then trim
+    text = text[:int(len(text) * available / pdf.get_string_width(text))]
+    while text and pdf.get_string_width(text + '...') > available:
+        text = text[:-1]
+    return text + '...'
+
+def _pdf_row(bug: Bug) -> Tuple[str, ...]:
+    return (
+        bug.id[:8],
+        bug.title or '',
+        bug.status.value,
+        bug.severity.value,
+        bug.priority.value,
+        bug.assigned_to or '',
+        bug.created_at.strftime('%Y-%m-%d %H:%M') if bug.created_at else ''
+    )
+
+def _summary_lines(statistics: Dict) -> List[str]:
+    lines = [f"Total bugs: {statistics['total_bugs']}"]
+    for label, key in (('Status', 'status_distribution'),
+                       ('Severity', 'severity_distribution'),
+                       ('Priority', 'priority_distribution')):
+        counts = ', '.join(f"{value}: {count}"
+                           for value, count in sorted(statistics[key].items()) if count)
+        lines.append(f"{label} - {counts or 'none'}")
+    return lines
+
+def _render_pdf(rows: Iterable[Tuple[str, ...]], filepath: str,
+                statistics: Optional[Dict] = None) -> str:
+    """Write one table PDF, with the summary header when statistics are given"""
+    pdf = _TablePDF()
+    pdf.summary_pending = statistics is not None
+    pdf.add_page()
+    if statistics is not None:
+        pdf.set_font('Arial', 'B', 16)
+        pdf.cell(0, 10, 'Bug Report', 0, 1, 'C')
+        pdf.set_font('Arial', '', 9)
+        pdf.cell(0, 5, f"Generated {datetime.now():%Y-%m-%d %H:%M}", 0, 1, 'C')
+        pdf.ln(2)
+        for line in _summary_lines(statistics):
+            pdf.cell(0, 5, _latin1(line), 0, 1)
+        pdf.ln(3)
+        pdf.summary_pending = False
+        pdf.table_header()
+
+    for row in rows:
+        for value, (_, width) in zip(row, PDF_COLUMNS):
+            pdf.cell(width, PDF_ROW_HEIGHT, _fit(pdf, value, width), 'B')
+        pdf.ln()
+
+    pdf.output(filepath)
+    return filepath
+
+def _chunks(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
 
 class ReportService:
     def __init__(self):
@@ -10,45 +128,79 @@ class ReportService:
         self.reports_dir = os.path.join(os.getcwd(), 'reports')
         os.makedirs(self.reports_dir, exist_ok=True)
 
-    def generate_excel_report(self, bugs: List[Bug], filename: str) -> str:
-        """Generate Excel report of bugs"""
-        df = pd.DataFrame([{
-            'ID': bug.id,
-            'Title': bug.title,
-            'Status': bug.status.value,
-            'Severity': bug.severity.value,
-            'Priority': bug.priority.value,
-            'Assigned To': bug.assigned_to,
-            'Created At': bug.created_at,
-            'Description': bug.description,
-            'Steps to Reproduce': bug.steps_to_reproduce,
-            'Expected Result': bug.expected_result,
-            'Actual Result': bug.actual_result
-        } for bug in bugs])
-        
+    def generate_excel_report(self, bugs: Iterable[Bug], filename: str) -> str:
+        """Generate Excel report of bugs, writing each row as it is read"""
+        # A write-only workbook flushes rows to disk as they are appended, so
+        # memory stays flat when bugs is a stream such as BugService.iter_bugs
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet('Bugs')
+        sheet.append(EXCEL_COLUMNS)
+        for bug in bugs:
+            sheet.append([
+                bug.id,
+                bug.title,
+                bug.status.value,
+                bug.severity.value,
+                bug.priority.value,
+                bug.assigned_to,
+                bug.created_at,
+                bug.description,
+                bug.steps_to_reproduce,
+                bug.expected_result,
+                bug.actual_result
+            ])
+
         filepath = os.path.join(self.reports_dir, f"{filename}.xlsx")
-        df.to_excel(filepath, index=False)
+        workbook.save(filepath)
         return filepath
 
-    def generate_pdf_report(self, bugs: List[Bug], filename: str) -> str:
-        """Generate PDF report of bugs"""
-        pdf = FPDF()
-        pdf.add_page()
-        
-        # Add report content
-        pdf.set_font('Arial', 'B', 16)
-        pdf.cell(0, 10, 'Bug Report', 0, 1, 'C')
-        
-        pdf.set_font('Arial', '', 12)
-        for bug in bugs:
-            pdf.cell(0, 10, f"Bug ID: {bug.id}", 0, 1)
-            pdf.cell(0, 10, f"Title: {bug.title}", 0, 1)
-            pdf.cell(0, 10, f"Status: {bug.status.value}", 0, 1)
-            pdf.cell(0, 10, f"Severity: {bug.severity.value}", 0, 1)
-            pdf.cell(0, 10, f"Priority: {bug.priority.value}", 0, 1)
-            pdf.cell(0, 10, f"Assigned To: {bug.assigned_to}", 0, 1)
-            pdf.cell(0, 10, '', 0, 1)  # Empty line
-            
+    def generate_pdf_report(self, bugs: Iterable[Bug], filename: str,
+                            statistics: Optional[Dict] = None,
+                            rows_per_part: Optional[int] = None,
+                            max_workers: Optional[int] = None) -> str:
+        """Generate PDF report of bugs as a table, one row per bug.
+
+        statistics fills the summary header and has the shape returned by
+        AnalyticsService.get_bug_statistics; without it the bugs are read
+        into memory to count them. With rows_per_part, reports longer than
+        one part are rendered in parallel processes and concatenated.
+        """
+        if statistics is None:
+            bugs = list(bugs)
+            statistics = AnalyticsService().get_bug_statistics(bugs)
+
         filepath = os.path.join(self.reports_dir, f"{filename}.pdf")
-        pdf.output(filepath)
-        return filepath
\ No newline at end of file
+        rows = (_pdf_row(bug) for bug in bugs)
+        if not rows_per_part:
+            return _render_pdf(rows, filepath, statistics)
+
+        chunks = _chunks(rows, rows_per_part)
+        first = next(chunks, [])
+        second = next(chunks, None)
+        if second is None:
+            return _render_pdf(first, filepath, statistics)
+        self._render_parts(chain([first, second], chunks), filepath, statistics, max_workers)
+        return filepath
+
+    def _render_parts(self, chunks: Iterable[list], filepath: str, statistics: Dict,
+                      max_workers: Optional[int] = None):
+        """Render chunks in a process pool and concatenate the parts in order"""
+        max_workers = max_workers or os.cpu_count() or 1
+        # Spawned workers do not inherit the caller's threads and open connections
+        context = multiprocessing.get_context('spawn')
+        with tempfile.TemporaryDirectory(dir=self.reports_dir) as parts_dir, \
+                ProcessPoolExecutor(max_workers, mp_context=context) as executor:
+            futures = []
+            for number, chunk in enumerate(chunks):
+                # Keep about two chunks per worker queued to bound memory
+                if number >= 2 * max_workers:
+                    futures[number - 2 * max_workers].result()
+                part_path = os.path.join(parts_dir, f"part-{number:05d}.pdf")
+                futures.append(executor.submit(
+                    _render_pdf, chunk, part_path, statistics if number == 0 else None))
+
+            writer = PdfWriter()
+            for future in futures:
+                writer.append(future.result())
+            with open(filepath, 'wb') as file:
+                writer.write(file)
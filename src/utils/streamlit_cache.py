@@ -0,0 +1,121 @@
+# src/utils/streamlit_cache.py
+"""Process-wide services and cached reads shared by the Streamlit pages.
+
+Cached reads take the database change version as their first argument, so
+a write committed by any server process makes the next rerun miss and re-query.
+"""
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+import pandas as pd
+import streamlit as st
+from ..database.db_manager import DatabaseManager
+from ..models.bug import Bug, BugSummary, SearchResult
+from ..services.analytics_service import AnalyticsService
+from ..services.bug_service import BugService
+from ..services.export_service import ExportService
+from ..services.report_job_service import ReportJobService
+from ..services.report_service import ReportService
+
+CACHE_ENTRIES = 64
+
+@st.cache_resource
+def get_db_manager() -> DatabaseManager:
+    return DatabaseManager()
+
+@st.cache_resource
+def get_bug_service() -> BugService:
+    return BugService(get_db_manager())
+
+@st.cache_resource
+def get_report_service() -> ReportService:
+    return ReportService()
+
+@st.cache_resource
+def get_report_job_service() -> ReportJobService:
+    return ReportJobService(get_bug_service(), get_report_service(),
+                            ExportService(get_db_manager()))
+
+@st.cache_resource
+def get_analytics_service() -> AnalyticsService:
+    return AnalyticsService(get_db_manager())
+
+@st.cache_data(max_entries=CACHE_ENTRIES)
+def _bug(version: int, bug_id: str) -> Optional[Bug]:
+    return get_bug_service().get_bug(bug_id, version)
+
+@st.cache_data(max_entries=CACHE_ENTRIES)
+def _bug_summaries(version: int, limit: Optional[int]) -> List[BugSummary]:
+    return get_bug_service().get_bug_summaries(limit=limit)
+
+@st.cache_data(max_entries=CACHE_ENTRIES)
+def _bug_page(version: int, filters: dict, sort: str, cursor: Optional[str],
+              limit: int) -> Tuple[List[BugSummary], Optional[str]]:
+    return get_bug_service().list_bugs(filters, sort, cursor, limit)
+
+@st.cache_data(max_entries=CACHE_ENTRIES)
+def _search_results(version: int, query: str, filters: dict,
+                    limit: int) -> List[SearchResult]:
+    return get_bug_service().search(query, filters, limit)
+
+@st.cache_data(max_entries=CACHE_ENTRIES)
+def _bug_statistics(version: int) -> Dict:
+    return get_analytics_service().get_bug_statistics()
+
+@st.cache_data(max_entries=CACHE_ENTRIES)
+def _trend(version: int, granularity: str, filters: dict) -> pd.Series:
+    return get_analytics_service().get_trend(granularity, filters=filters)
+
+@st.cache_data(max_entries=CACHE_ENTRIES)
+def _resolution_time_stats(version: int, filters: dict) -> Dict:
+    return get_analytics_service().get_resolution_time_stats(filters)
+
+@st.cache_data(max_entries=CACHE_ENTRIES)
+def _open_bug_age_histogram(version: int, day: date, filters: dict) -> Dict[str, int]:
+    return get_analytics_service().get_open_bug_age_histogram(filters)
+
+@st.cache_data(max_entries=CACHE_ENTRIES)
+def _weekly_flow(version: int) -> pd.DataFrame:
+    return get_analytics_service().get_weekly_flow()
+
+@st.cache_data(max_entries=CACHE_ENTRIES)
+def _bug_frame(version: int, filters: dict) -> pd.DataFrame:
+    return get_analytics_service().get_bug_frame(filters)
+
+@st.cache_data(max_entries=CACHE_ENTRIES)
+def _priority_severity_table(version: int) -> pd.DataFrame:
+    return get_analytics_service().get_priority_severity_table()
+
+def load_bug(bug_id: str) -> Optional[Bug]:
+    return _bug(get_db_manager().change_version, bug_id)
+
+def load_bug_summaries(limit: Optional[int] = None) -> List[BugSummary]:
+    return _bug_summaries(get_db_manager().change_version, limit)
+
+def load_bug_page(filters: dict = None, sort: str = 'newest', cursor: Optional[str] = None,
+                  limit: int = 50) -> Tuple[List[BugSummary], Optional[str]]:
+    return _bug_page(get_db_manager().change_version, filters, sort, cursor, limit)
+
+def load_search_results(query: str, filters: dict = None, limit: int = 20) -> List[SearchResult]:
+    return _search_results(get_db_manager().change_version, query, filters, limit)
+
+def load_bug_statistics() -> Dict:
+    return _bug_statistics(get_db_manager().change_version)
+
+def load_trend(granularity: str = 'Daily', filters: dict = None) -> pd.Series:
+    return _trend(get_db_manager().change_version, granularity, filters)
+
+def load_resolution_time_stats(filters: dict = None) -> Dict:
+    return _resolution_time_stats(get_db_manager().change_version, filters)
+
+def load_open_bug_age_histogram(filters: dict = None) -> Dict[str, int]:
+    # Ages grow without writes, so the day is part of the key as well
+    return _open_bug_age_histogram(get_db_manager().change_version, date.today(), filters)
+
+def load_weekly_flow() -> pd.DataFrame:
+    return _weekly_flow(get_db_manager().change_version)
+
+def load_bug_frame(filters: dict = None) -> pd.DataFrame:
+    return _bug_frame(get_db_manager().change_version, filters)
+
+def load_priority_severity_table() -> pd.DataFrame:
+    return _priority_severity_table(get_db_manager().change_version)
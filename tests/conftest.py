@@ -4,4 +4,11 @@ import os
 import sys
 
 # Add the project root directory to Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
\ No newline at end of file
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.database.db_manager import DatabaseManager
+
+@pytest.fixture
+def db_manager(tmp_path, monkeypatch):
+    monkeypatch.setenv('DB_PATH', f"sqlite:///{tmp_path / 'test_bugs.db'}")
+    return DatabaseManager()
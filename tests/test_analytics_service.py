@@ -1,8 +1,10 @@
 # tests/test_analytics_service.py
 import pytest
+import pandas as pd
 from src.services.analytics_service import AnalyticsService
 from src.models.bug import Bug, Status, Severity, Priority
-from datetime import datetime
+from dataclasses import replace
+from datetime import date, datetime, timedelta
 
 @pytest.fixture
 def analytics_service():
@@ -51,4 +53,102 @@ def test_get_bug_statistics(analytics_service, sample_bugs):
     assert stats['resolved_bugs'] == 1
     assert stats['status_distribution']['Open'] == 1
     assert stats['severity_distribution']['High'] == 1
-    assert stats['priority_distribution']['Medium'] == 1
\ No newline at end of file
+    assert stats['priority_distribution']['Medium'] == 1
+
+def test_get_bug_statistics_from_database(db_manager, sample_bugs):
+    for bug in sample_bugs:
+        db_manager.save_bug(bug)
+    analytics_service = AnalyticsService(db_manager)
+
+    assert analytics_service.get_bug_statistics() == \
+        analytics_service.get_bug_statistics(sample_bugs)
+    assert analytics_service.get_priority_severity_matrix() == {
+        ('High', 'High'): 1,
+        ('Medium', 'Medium'): 1
+    }
+
+def test_frame_metrics_match_database_statistics(db_manager, sample_bugs):
+    for bug in sample_bugs:
+        db_manager.save_bug(bug)
+    db_manager.save_bug(replace(sample_bugs[0], id="3", created_at=datetime(2024, 1, 3, 10, 0)))
+    analytics_service = AnalyticsService(db_manager)
+
+    frame = analytics_service.get_bug_frame()
+    assert analytics_service.get_frame_statistics(frame) == \
+        analytics_service.get_bug_statistics()
+
+    matrix = analytics_service.get_priority_severity_frame(frame)
+    assert matrix.loc['High', 'High'] == 2
+    assert matrix.loc['Low', 'Critical'] == 0
+    table = analytics_service.get_priority_severity_table()
+    assert table.to_numpy().tolist() == matrix.to_numpy().tolist()
+    assert list(table.index) == ['Low', 'Medium', 'High']
+
+    filters = {'severity_filter': ['High'], 'start_date': date(2024, 1, 1),
+               'end_date': date(2024, 1, 31)}
+    filtered = analytics_service.get_frame_statistics(analytics_service.get_bug_frame(filters))
+    assert filtered == analytics_service.db_manager.get_bug_statistics(**filters)
+    assert filtered['total_bugs'] == 1
+
+def test_resolution_metrics_follow_status_changes(db_manager, sample_bugs):
+    created_at = datetime(2024, 1, 1, 9, 0)
+    for i in range(4):
+        db_manager.save_bug(replace(sample_bugs[0], id=str(i), created_at=created_at,
+                                    updated_at=created_at))
+    for i, hours in enumerate([1, 2, 10]):
+        db_manager.update_bug_fields(str(i), {
+            'status': Status.RESOLVED,
+            'updated_at': created_at + timedelta(hours=hours)
+        })
+    # Closing a resolved bug keeps its original resolution time
+    db_manager.update_bug_fields("2", {'status': Status.CLOSED,
+                                       'updated_at': datetime(2024, 3, 1)})
+    analytics_service = AnalyticsService(db_manager)
+
+    stats = analytics_service.get_resolution_time_stats()
+    assert stats['resolved_bugs'] == 3
+    assert stats['mean'] == timedelta(hours=13 / 3)
+    assert stats['median'] == timedelta(hours=2)
+    assert stats['p90'] == timedelta(hours=10)
+
+    assert db_manager.get_open_bug_ages(now=datetime(2024, 1, 20)) == {
+        '< 1 day': 0, '1-7 days': 0, '1-4 weeks': 1, '1-3 months': 0, '> 3 months': 0
+    }
+
+    flow = analytics_service.get_weekly_flow()
+    assert flow.to_dict('records') == [
+        {'Week': date(2024, 1, 1), 'Opened': 4, 'Resolved': 3, 'Net Change': 1}
+    ]
+
+def test_bug_inserted_resolved_is_resolved_at_its_updated_at(db_manager, sample_bugs):
+    # Imports insert bugs in their final status in a single write
+    db_manager.save_bug(replace(sample_bugs[0], status=Status.RESOLVED,
+                                created_at=datetime(2024, 1, 1, 9, 0),
+                                updated_at=datetime(2024, 1, 11, 9, 0)))
+
+    stats = AnalyticsService(db_manager).get_resolution_time_stats()
+    assert stats['resolved_bugs'] == 1
+    assert stats['mean'] == stats['median'] == stats['p90'] == timedelta(days=10)
+
+def test_trend_reads_rollup_and_follows_writes(db_manager, sample_bugs):
+    for i, day in enumerate([1, 2, 9, 31]):
+        created_at = datetime(2024, 1, day, 12, 0)
+        db_manager.save_bug(replace(sample_bugs[i % 2], id=str(i), created_at=created_at,
+                                    updated_at=created_at))
+    analytics_service = AnalyticsService(db_manager)
+
+    weekly = analytics_service.get_trend('Weekly')
+    assert weekly.to_dict() == {
+        pd.Timestamp(2024, 1, 1): 2, pd.Timestamp(2024, 1, 8): 1,
+        pd.Timestamp(2024, 1, 15): 0, pd.Timestamp(2024, 1, 22): 0,
+        pd.Timestamp(2024, 1, 29): 1
+    }
+    daily = analytics_service.get_trend('Daily', date(2024, 1, 1), date(2024, 1, 3),
+                                        {'severity_filter': ["High"]})
+    assert list(daily) == [1, 0, 0]
+
+    db_manager.update_bug_fields("0", {'status': Status.CLOSED})
+    db_manager.delete_bug("2")
+    monthly = analytics_service.get_trend('Monthly', filters={'status_filter': ["Closed"]})
+    assert monthly.to_dict() == {pd.Timestamp(2024, 1, 1): 1}
+    assert analytics_service.get_trend('Weekly').sum() == 3
@@ -1,26 +1,59 @@
 # tests/test_bug_service.py
 import pytest
+from dataclasses import replace
 from datetime import datetime
 import time
 from src.models.bug import Bug, Status, Severity, Priority
+from src.database.db_manager import DatabaseManager
 from src.services.bug_service import BugService
+from src.utils.lru_cache import LRUCache
 
 # Mock Database Manager
 class MockDBManager:
     def __init__(self):
         self.bugs = {}
+        self.reads = 0
+        self.version = 0
+        self.version_reads = 0
+
+    @property
+    def change_version(self):
+        self.version_reads += 1
+        return self.version
 
     def save_bug(self, bug):
         self.bugs[bug.id] = bug
         return bug
 
     def get_bug(self, bug_id):
+        self.reads += 1
         return self.bugs.get(bug_id)
 
+    def delete_bug(self, bug_id):
+        return self.bugs.pop(bug_id, None) is not None
+
+    def save_bugs(self, bugs, batch_size=1000):
+        saved = 0
+        for bug in bugs:
+            self.bugs[bug.id] = bug
+            saved += 1
+        return saved
+
     def update_bug(self, bug):
         self.bugs[bug.id] = bug
         return bug
 
+    def update_bug_fields(self, bug_id, changes, expected_version=None):
+        bug = self.bugs.get(bug_id)
+        if bug is None:
+            return None, False
+        if expected_version is not None and bug.version != expected_version:
+            return None, True
+        for key, value in changes.items():
+            setattr(bug, key, value)
+        bug.version += 1
+        return bug, False
+
 # Fixtures
 @pytest.fixture
 def db_manager():
@@ -81,4 +114,100 @@ def test_update_nonexistent_bug(bug_service):
         'status': Status.IN_PROGRESS
     }
     result = bug_service.update_bug('nonexistent-id', update_data)
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+def test_create_bugs(bug_service, db_manager, sample_bug_data):
+    saved = bug_service.create_bugs(dict(sample_bug_data) for _ in range(3))
+
+    assert saved == 3
+    assert len(db_manager.bugs) == 3
+    assert all(bug.status == Status.OPEN for bug in db_manager.bugs.values())
+
+def test_update_bug_detects_concurrent_change(bug_service, sample_bug_data):
+    bug = bug_service.create_bug(sample_bug_data)
+    seen_version = bug.version
+
+    first, conflict = bug_service.try_update_bug(
+        bug.id, {'status': Status.IN_PROGRESS}, seen_version)
+    assert first is not None and not conflict
+    assert first.version == seen_version + 1
+
+    # A second writer still holding the old version loses
+    second, conflict = bug_service.try_update_bug(
+        bug.id, {'status': Status.CLOSED}, seen_version)
+    assert second is None and conflict
+    assert bug_service.get_bug(bug.id).status == Status.IN_PROGRESS
+
+    missing, conflict = bug_service.try_update_bug('nonexistent-id', {'title': 'x'})
+    assert missing is None and not conflict
+
+def test_get_bug_is_cached_until_updated_or_deleted(bug_service, db_manager, sample_bug_data):
+    bug = bug_service.create_bug(sample_bug_data)
+
+    bug_service.get_bug(bug.id).title = "Changed by caller"
+    assert bug_service.get_bug(bug.id).title == 'Test Bug'
+    assert db_manager.reads == 1
+
+    bug_service.update_bug(bug.id, {'title': 'Updated'})
+    assert bug_service.get_bug(bug.id).title == 'Updated'
+    assert db_manager.reads == 2
+
+    assert bug_service.delete_bug(bug.id)
+    assert bug_service.get_bug(bug.id) is None
+    stats = bug_service.cache_stats()
+    assert (stats.hits, stats.misses) == (1, 3)
+
+def test_bug_cache_evicts_least_recently_used(db_manager, sample_bug_data):
+    bug_service = BugService(db_manager, cache_size=2)
+    first, second, third = (bug_service.create_bug(sample_bug_data) for _ in range(3))
+
+    bug_service.get_bug(first.id)
+    bug_service.get_bug(second.id)
+    bug_service.get_bug(first.id)
+    bug_service.get_bug(third.id)
+    bug_service.get_bug(first.id)
+    bug_service.get_bug(second.id)
+
+    stats = bug_service.cache_stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (2, 4, 2, 2)
+
+def test_bug_cache_is_dropped_when_another_process_writes(bug_service, db_manager, sample_bug_data):
+    bug = bug_service.create_bug(sample_bug_data)
+    bug_service.get_bug(bug.id)
+
+    db_manager.bugs[bug.id] = replace(bug, title="Written elsewhere")
+    db_manager.version += 1
+    # Hits within the check interval stay in memory
+    assert bug_service.get_bug(bug.id).title == 'Test Bug'
+    assert db_manager.version_reads == 1
+
+    bug_service._version_checked_at -= 1
+    assert bug_service.get_bug(bug.id).title == "Written elsewhere"
+    assert db_manager.version_reads == 2
+
+def test_get_bug_with_current_version_sees_writes_from_another_process(
+        tmp_path, monkeypatch, sample_bug_data):
+    monkeypatch.setenv('DB_PATH', f"sqlite:///{tmp_path / 'test_bugs.db'}")
+    reader = BugService(DatabaseManager(), version_check_interval=60)
+    bug = reader.create_bug(sample_bug_data)
+    reader.get_bug(bug.id)
+
+    # A second server process has its own engine and BugService
+    monkeypatch.setattr('src.database.db_manager._engines', {})
+    writer = BugService(DatabaseManager())
+    writer.update_bug(bug.id, {'title': 'Written elsewhere'})
+
+    assert reader.get_bug(bug.id).title == 'Test Bug'
+    version = reader.db_manager.change_version
+    assert reader.get_bug(bug.id, version).title == 'Written elsewhere'
+
+def test_cache_entries_expire_after_ttl():
+    now = [0.0]
+    cache = LRUCache(8, ttl=10, clock=lambda: now[0])
+    cache.put('bug', 'value')
+
+    now[0] = 9.9
+    assert cache.get('bug') == 'value'
+    now[0] = 10
+    assert cache.get('bug') is None
+    assert cache.stats().evictions == 1
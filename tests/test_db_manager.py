@@ -0,0 +1,446 @@
+import pytest
+import sqlite3
+from dataclasses import replace
+from sqlalchemy.exc import IntegrityError
+from datetime import datetime, date
+from src.database.db_manager import DatabaseManager, _STATS_TRIGGERS
+from src.services.bug_service import BugService
+from src.models.bug import Bug, BugEventType, BugRow, BugSummary, Status, Severity, Priority
+
+def make_bug(bug_id, status=Status.OPEN, severity=Severity.HIGH,
+             priority=Priority.HIGH, created_at=None):
+    created_at = created_at or datetime(2024, 1, 15, 12, 0)
+    return Bug(
+        id=bug_id,
+        title=f"Bug {bug_id}",
+        description="Test",
+        severity=severity,
+        priority=priority,
+        status=status,
+        assigned_to="john.doe",
+        created_by="jane.doe",
+        created_at=created_at,
+        updated_at=created_at,
+        steps_to_reproduce="Steps",
+        expected_result="Expected",
+        actual_result="Actual"
+    )
+
+@pytest.fixture
+def populated_db(db_manager):
+    db_manager.save_bug(make_bug("1", Status.OPEN, Severity.HIGH, Priority.HIGH,
+                                 datetime(2024, 1, 1, 9, 0)))
+    db_manager.save_bug(make_bug("2", Status.RESOLVED, Severity.LOW, Priority.MEDIUM,
+                                 datetime(2024, 1, 10, 23, 59)))
+    db_manager.save_bug(make_bug("3", Status.IN_PROGRESS, Severity.CRITICAL, Priority.HIGH,
+                                 datetime(2024, 2, 1, 0, 0)))
+    return db_manager
+
+def test_get_filtered_bugs_without_filters(populated_db):
+    bugs = populated_db.get_filtered_bugs()
+    assert {bug.id for bug in bugs} == {"1", "2", "3"}
+
+def test_get_filtered_bugs_by_enum_values(populated_db):
+    bugs = populated_db.get_filtered_bugs(
+        status_filter=["Open", "In Progress"],
+        priority_filter=["High"]
+    )
+    assert {bug.id for bug in bugs} == {"1", "3"}
+
+    bugs = populated_db.get_filtered_bugs(severity_filter=["Low"])
+    assert [bug.id for bug in bugs] == ["2"]
+
+def test_get_filtered_bugs_date_range_is_inclusive(populated_db):
+    bugs = populated_db.get_filtered_bugs(
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 1, 10)
+    )
+    assert {bug.id for bug in bugs} == {"1", "2"}
+
+def test_migration_upgrades_existing_database(tmp_path, monkeypatch):
+    db_file = tmp_path / 'legacy.db'
+    connection = sqlite3.connect(db_file)
+    connection.execute(
+        "CREATE TABLE bugs (id VARCHAR NOT NULL, title VARCHAR NOT NULL, "
+        "description VARCHAR, severity VARCHAR(8), priority VARCHAR(6), "
+        "status VARCHAR(11), assigned_to VARCHAR, created_by VARCHAR, "
+        "created_at DATETIME, updated_at DATETIME, steps_to_reproduce VARCHAR, "
+        "expected_result VARCHAR, actual_result VARCHAR, PRIMARY KEY (id))"
+    )
+    connection.execute(
+        "INSERT INTO bugs (id, title, severity, priority, status, created_at) "
+        "VALUES ('legacy', 'Legacy bug', 'LOW', 'LOW', 'OPEN', '2023-05-01 10:00:00.000000')"
+    )
+    connection.execute(
+        "INSERT INTO bugs (id, title, severity, priority, status, created_at, updated_at) "
+        "VALUES ('fixed', 'Fixed bug', 'LOW', 'LOW', 'RESOLVED', "
+        "'2023-05-01 10:00:00.000000', '2023-05-02 10:00:00.000000')"
+    )
+    connection.commit()
+    connection.close()
+
+    monkeypatch.setenv('DB_PATH', f"sqlite:///{db_file}")
+    db_manager = DatabaseManager()
+    assert db_manager.get_bug_statistics()['open_bugs'] == 1
+    # Status history is backfilled from created_at and updated_at
+    assert db_manager.get_resolution_times()['median'] == pytest.approx(86400)
+    assert db_manager.get_trend_counts('month') == {date(2023, 5, 1): 2}
+    # The change feed starts with the current state of every bug
+    events = db_manager.get_events()
+    assert [(event.bug_id, event.event_type) for event in events] == [
+        ('fixed', BugEventType.CREATED), ('legacy', BugEventType.CREATED)]
+    assert events[0].changes['status'] == (None, Status.RESOLVED)
+    assert 'description' not in events[0].changes
+
+    connection = sqlite3.connect(db_file)
+    indexes = {row[0] for row in connection.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'bugs'")}
+    connection.close()
+    assert {'ix_bugs_status_created_at', 'ix_bugs_assigned_to_status',
+            'ix_bugs_severity_priority'} <= indexes
+
+def test_list_bugs_walks_every_page_once(db_manager):
+    # Several bugs share a timestamp so the id tiebreaker matters
+    for i in range(7):
+        db_manager.save_bug(make_bug(f"bug-{i}", created_at=datetime(2024, 1, 1 + i // 3)))
+    bug_service = BugService(db_manager)
+
+    seen, cursor = [], None
+    while True:
+        bugs, cursor = bug_service.list_bugs(cursor=cursor, limit=3)
+        seen.extend(bugs)
+        if cursor is None:
+            break
+
+    assert len(seen) == 7
+    assert len({bug.id for bug in seen}) == 7
+    keys = [(bug.created_at, bug.id) for bug in seen]
+    assert keys == sorted(keys, reverse=True)
+
+    oldest, _ = bug_service.list_bugs(
+        {'status_filter': ["Open"]}, sort='oldest', limit=2)
+    assert [bug.id for bug in oldest] == ["bug-0", "bug-1"]
+
+def test_list_views_load_summaries_without_long_text(populated_db):
+    bugs, _ = BugService(populated_db).list_bugs(limit=2)
+
+    assert [bug.id for bug in bugs] == ["3", "2"]
+    assert isinstance(bugs[0], BugSummary)
+    assert not hasattr(bugs[0], 'description')
+    assert bugs[0].status == Status.IN_PROGRESS
+
+    summaries = populated_db.get_bug_summaries(limit=2, status_filter=["Open", "Resolved"])
+    assert [bug.id for bug in summaries] == ["2", "1"]
+    assert populated_db.get_bug("2").description == "Test"
+
+def test_list_bugs_rejects_invalid_cursor(db_manager):
+    with pytest.raises(ValueError):
+        BugService(db_manager).list_bugs(cursor="not-a-cursor")
+
+def test_bug_stats_follow_writes(populated_db):
+    populated_db.delete_bug("2")
+    bug = populated_db.get_bug("1")
+    bug.status = Status.CLOSED
+    populated_db.update_bug(bug)
+
+    stats = populated_db.get_bug_statistics()
+    assert stats['total_bugs'] == 2
+    assert stats['status_distribution'] == {'Closed': 1, 'In Progress': 1}
+    assert stats['severity_distribution'] == {'High': 1, 'Critical': 1}
+    assert populated_db.get_trend_counts('day') == {
+        date(2024, 1, 1): 1,
+        date(2024, 2, 1): 1
+    }
+    assert populated_db.verify_bug_stats() == {}
+
+def test_rebuild_bug_stats_reports_and_fixes_drift(populated_db):
+    with populated_db.engine.begin() as connection:
+        connection.exec_driver_sql(
+            "UPDATE bug_stats SET count = 5 WHERE dimension = 'status' AND value = 'OPEN'")
+
+    assert populated_db.verify_bug_stats() == {('status', 'OPEN'): (5, 1)}
+    assert populated_db.rebuild_bug_stats() == {('status', 'OPEN'): (5, 1)}
+    assert populated_db.verify_bug_stats() == {}
+    assert populated_db.get_bug_statistics()['open_bugs'] == 1
+
+def test_bug_stats_skip_null_values(populated_db):
+    with populated_db.engine.begin() as connection:
+        connection.exec_driver_sql(
+            "INSERT INTO bugs (id, title, severity, priority) VALUES ('raw', 'Raw', 'LOW', 'LOW')")
+        connection.exec_driver_sql("UPDATE bugs SET severity = NULL WHERE id = 'raw'")
+
+    stats = populated_db.get_bug_statistics()
+    assert stats['total_bugs'] == 3
+    assert stats['priority_distribution'] == {'High': 2, 'Medium': 1, 'Low': 1}
+    assert populated_db.verify_bug_stats() == {}
+
+def test_save_bugs_inserts_in_batches(db_manager):
+    saved = db_manager.save_bugs(
+        (make_bug(f"bulk-{i}") for i in range(25)), batch_size=10)
+
+    assert saved == 25
+    assert len(db_manager.get_all_bugs()) == 25
+    assert db_manager.get_bug_statistics()['open_bugs'] == 25
+
+def test_iter_bugs_streams_filtered_bugs_in_creation_order(populated_db):
+    bugs = populated_db.iter_bugs(batch_size=1, status_filter=["Open", "In Progress"])
+
+    assert [bug.id for bug in bugs] == ["1", "3"]
+    assert populated_db.count_bugs(status_filter=["Open", "In Progress"]) == 2
+    assert populated_db.count_bugs() == 3
+
+def test_iter_bug_rows_returns_compact_tuples(populated_db):
+    rows = list(populated_db.iter_bug_rows(batch_size=2))
+    bug = populated_db.get_bug("1")
+
+    assert [row.id for row in rows] == ["1", "2", "3"]
+    assert all(type(row) is BugRow for row in rows)
+    assert rows[0] == BugRow(*(getattr(bug, name) for name in BugRow._fields))
+    assert rows[0].assigned_to is rows[1].assigned_to
+    assert not hasattr(bug, '__dict__')
+
+def test_read_frame_uses_categorical_enums(populated_db):
+    frame = populated_db.read_frame(['id', 'status', 'created_at'], severity_filter=["Low", "High"])
+
+    assert list(frame['id']) == ["1", "2"]
+    assert list(frame['status']) == ["Open", "Resolved"]
+    assert list(frame['status'].cat.categories) == [status.value for status in Status]
+    assert frame['created_at'][1] == datetime(2024, 1, 10, 23, 59)
+
+    empty = populated_db.read_frame(['status', 'created_at'], status_filter=["Closed"])
+    assert empty.empty
+    assert str(empty['status'].dtype) == 'category'
+    assert str(empty['created_at'].dtype) == 'datetime64[ns]'
+
+def test_update_status_transitions_matching_bugs(populated_db):
+    updated = populated_db.update_status(
+        Status.CLOSED, status_filter=["Open", "Resolved"])
+
+    assert updated == 2
+    stats = populated_db.get_bug_statistics()
+    assert stats['status_distribution'] == {'Closed': 2, 'In Progress': 1}
+    assert populated_db.verify_bug_stats() == {}
+
+def test_managers_share_engine_and_recover_from_failed_writes(db_manager):
+    other = DatabaseManager()
+    assert other.engine is db_manager.engine
+
+    db_manager.save_bug(make_bug("dup"))
+    with pytest.raises(IntegrityError):
+        other.save_bug(make_bug("dup"))
+
+    # The failed unit of work was rolled back and left nothing behind
+    other.save_bug(make_bug("next"))
+    assert {bug.id for bug in db_manager.get_all_bugs()} == {"dup", "next"}
+    assert db_manager.verify_bug_stats() == {}
+
+def test_sqlite_connections_use_tuning_profile(tmp_path, monkeypatch):
+    monkeypatch.setenv('DB_PATH', f"sqlite:///{tmp_path / 'tuned.db'}")
+    monkeypatch.setenv('DB_SYNCHRONOUS', 'FULL')
+    monkeypatch.setenv('DB_BUSY_TIMEOUT', '1234')
+    db_manager = DatabaseManager()
+
+    with db_manager.engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == 'wal'
+        assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == 2
+        assert connection.exec_driver_sql("PRAGMA busy_timeout").scalar() == 1234
+        assert connection.exec_driver_sql("PRAGMA temp_store").scalar() == 2
+
+def test_sqlite_tuning_rejects_unsafe_values(tmp_path, monkeypatch):
+    monkeypatch.setenv('DB_PATH', f"sqlite:///{tmp_path / 'unsafe.db'}")
+    monkeypatch.setenv('DB_JOURNAL_MODE', 'WAL; DROP TABLE bugs')
+    with pytest.raises(ValueError):
+        DatabaseManager()
+
+def test_readers_proceed_while_writer_holds_transaction(populated_db):
+    with populated_db.engine.connect() as writer:
+        writer.exec_driver_sql("BEGIN IMMEDIATE")
+        writer.exec_driver_sql("DELETE FROM bugs WHERE id = '1'")
+        # The uncommitted delete neither blocks nor leaks into other readers
+        assert len(populated_db.get_all_bugs()) == 3
+        writer.exec_driver_sql("ROLLBACK")
+
+def test_change_version_moves_on_writes_only(db_manager):
+    version = db_manager.change_version
+    db_manager.get_all_bugs()
+    db_manager.get_bug_statistics()
+    assert db_manager.change_version == version
+
+    db_manager.save_bug(make_bug("1"))
+    assert db_manager.change_version > version
+    # Every manager for the same database sees the same version
+    assert DatabaseManager().change_version == db_manager.change_version
+
+def test_change_version_is_shared_across_processes(db_manager, monkeypatch):
+    db_manager.save_bug(make_bug("1"))
+    version = db_manager.change_version
+    assert not db_manager.has_changed_since(version)
+
+    # A fresh engine stands in for another server process on the same file
+    monkeypatch.setattr('src.database.db_manager._engines', {})
+    other_process = DatabaseManager()
+    assert other_process.engine is not db_manager.engine
+    assert other_process.change_version == version
+
+    other_process.delete_bug("1")
+    assert db_manager.has_changed_since(version)
+
+    # A rolled back write leaves the version alone
+    version = db_manager.change_version
+    db_manager.save_bug(make_bug("2"))
+    with pytest.raises(IntegrityError):
+        other_process.save_bug(make_bug("2"))
+    assert db_manager.change_version == version + 1
+
+def test_search_ranks_matches_and_follows_writes(db_manager):
+    crash = make_bug("crash")
+    crash.title = "App crashes on save"
+    crash.description = "Saving a large file"
+    mention = make_bug("mention")
+    mention.title = "Toolbar icons misaligned"
+    mention.actual_result = "Icons overlap after the crash dialog"
+    other = make_bug("other", status=Status.CLOSED)
+    other.title = "Crash when exporting"
+    for bug in (crash, mention, other):
+        db_manager.save_bug(bug)
+    bug_service = BugService(db_manager)
+
+    results = bug_service.search("crash")
+    # Title matches outrank a mention in the actual result
+    assert results[-1].bug.id == "mention"
+    assert {result.bug.id for result in results} == {"crash", "mention", "other"}
+    assert "**" in results[0].snippet
+
+    results = bug_service.search("crash", {'status_filter': ["Open"]})
+    assert {result.bug.id for result in results} == {"crash", "mention"}
+    assert len(bug_service.search('crash" (')) == 3
+    assert bug_service.search("***") == []
+
+    db_manager.delete_bug("mention")
+    crash.title = "App freezes on save"
+    crash.description = "Saving a large file"
+    db_manager.update_bug(crash)
+    assert [result.bug.id for result in bug_service.search("crash")] == ["other"]
+    assert [result.bug.id for result in bug_service.search("freezes")] == ["crash"]
+
+def test_search_index_survives_vacuum(db_manager):
+    for bug_id in ["a", "b", "c"]:
+        db_manager.save_bug(replace(make_bug(bug_id), title=f"Crash in module {bug_id}"))
+    db_manager.delete_bug("a")
+    with db_manager.engine.connect() as connection:
+        connection.exec_driver_sql("VACUUM")
+        connection.exec_driver_sql("INSERT INTO bugs_fts (bugs_fts, rank) VALUES ('integrity-check', 1)")
+
+    results = BugService(db_manager).search("crash")
+    assert sorted(result.bug.id for result in results) == ["b", "c"]
+
+def test_find_duplicates_follows_writes(db_manager):
+    original = make_bug("original")
+    original.title = "Application crashes when saving a large spreadsheet"
+    original.description = "Open a spreadsheet with 50k rows and press Save"
+    original.actual_result = "The application closes with a segmentation fault"
+    unrelated = make_bug("unrelated")
+    unrelated.title = "Toolbar icons are blurry on high DPI screens"
+    unrelated.description = "Icons look pixelated"
+    unrelated.actual_result = "Blurry icons"
+    db_manager.save_bugs([original, unrelated])
+    bug_service = BugService(db_manager)
+
+    report = {
+        'title': "Application crashes when saving large spreadsheet",
+        'description': "Open a spreadsheet with 50k rows and press Save",
+        'actual_result': "Application closes with segmentation fault"
+    }
+    duplicates = bug_service.find_duplicates(report)
+    assert [bug.id for bug, _ in duplicates] == ["original"]
+    assert duplicates[0][1] >= 0.5
+    assert bug_service.find_duplicates(report, exclude_id="original") == []
+
+    original.title = "Toolbar icons are blurry on high DPI screens"
+    original.description = "Icons look pixelated"
+    original.actual_result = "Blurry icons"
+    db_manager.update_bug(original)
+    assert bug_service.find_duplicates(report) == []
+
+    db_manager.delete_bug("unrelated")
+    with db_manager.engine.connect() as connection:
+        assert connection.exec_driver_sql(
+            "SELECT COUNT(*) FROM bug_lsh_buckets WHERE bug_id = 'unrelated'").scalar() == 0
+
+def test_update_bug_fields_writes_changes_with_optimistic_check(populated_db):
+    bug = populated_db.get_bug("1")
+    changed_at = datetime(2024, 3, 1, 8, 30)
+
+    updated, conflict = populated_db.update_bug_fields(
+        "1", {'status': Status.CLOSED, 'updated_at': changed_at}, bug.version)
+    assert not conflict
+    assert updated.status == Status.CLOSED
+    assert updated.title == bug.title
+    assert updated.version == bug.version + 1
+    assert populated_db.get_bug("1").updated_at == changed_at
+    assert populated_db.verify_bug_stats() == {}
+
+    # Writes within the same clock tick still conflict
+    stale, conflict = populated_db.update_bug_fields(
+        "1", {'status': Status.OPEN, 'updated_at': changed_at}, bug.version)
+    assert stale is None and conflict
+    assert populated_db.get_bug("1").status == Status.CLOSED
+
+    populated_db.update_status(Status.RESOLVED)
+    populated_db.update_bug(populated_db.get_bug("1"))
+    assert populated_db.get_bug("1").version == bug.version + 3
+
+    assert populated_db.update_bug_fields("missing", {'title': 'x'}) == (None, False)
+    with pytest.raises(ValueError):
+        populated_db.update_bug_fields("1", {'not_a_column': 1})
+
+def test_stats_triggers_from_older_versions_are_replaced_and_recounted(populated_db, monkeypatch):
+    with populated_db.engine.begin() as connection:
+        # Older versions also counted bugs per creation day
+        connection.exec_driver_sql(
+            "INSERT INTO bug_stats (dimension, value, count) VALUES ('created_day', '2024-01-01', 1)")
+        connection.exec_driver_sql("DROP TRIGGER bugs_stats_insert")
+        connection.exec_driver_sql(
+            "CREATE TRIGGER bugs_stats_insert AFTER INSERT ON bugs BEGIN SELECT 1; END")
+
+    monkeypatch.setattr('src.database.db_manager._engines', {})
+    upgraded = DatabaseManager()
+    assert upgraded.verify_bug_stats() == {}
+    with upgraded.engine.connect() as connection:
+        dimensions = {row[0] for row in connection.exec_driver_sql("SELECT dimension FROM bug_stats")}
+    assert dimensions == {'status', 'severity', 'priority'}
+    # Triggers that are already current are left alone
+    with upgraded.engine.begin() as connection:
+        assert upgraded._install_triggers(connection, _STATS_TRIGGERS) == set()
+
+def test_change_feed_records_every_write_with_old_and_new_values(db_manager):
+    bug_service = BugService(db_manager)
+    db_manager.save_bug(make_bug("1"))
+    created, cursor = bug_service.changes_since()
+    assert [event.event_type for event in created] == [BugEventType.CREATED]
+    assert created[0].changes['title'] == (None, "Bug 1")
+    assert created[0].changes['created_at'] == (None, datetime(2024, 1, 15, 12, 0))
+
+    bug_service.update_bug("1", {'title': "Renamed", 'status': Status.RESOLVED})
+    # Rewriting a value that did not change records nothing
+    db_manager.update_bug_fields("1", {'title': "Renamed"})
+    db_manager.delete_bug("1")
+
+    events, next_cursor = bug_service.changes_since(cursor, limit=1)
+    assert events[0].event_type == BugEventType.UPDATED
+    assert set(events[0].changes) == {'title', 'status', 'updated_at'}
+    assert events[0].changes['status'] == (Status.OPEN, Status.RESOLVED)
+
+    events, next_cursor = bug_service.changes_since(next_cursor)
+    assert [event.event_type for event in events] == [BugEventType.DELETED]
+    assert events[0].changes['title'] == ("Renamed", None)
+    assert bug_service.changes_since(next_cursor) == ([], next_cursor)
+    # History outlives the bug
+    assert len(bug_service.get_bug_history("1")) == 3
+
+def test_change_feed_is_written_in_the_same_transaction(db_manager):
+    db_manager.save_bug(make_bug("1"))
+    with pytest.raises(IntegrityError):
+        db_manager.save_bugs([make_bug("2"), make_bug("1")])
+
+    assert [event.bug_id for event in db_manager.get_events()] == ["1"]
@@ -0,0 +1,56 @@
+# tests/test_export_service.py
+import pytest
+import csv
+from datetime import datetime
+import pyarrow.ipc as pa_ipc
+import pyarrow.parquet as pq
+from src.models.bug import Bug, Status, Severity, Priority
+from src.services.export_service import ExportService
+
+@pytest.fixture
+def export_service(db_manager, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    db_manager.save_bugs(Bug(
+        id=f"bug-{i}",
+        title=f"Bug {i}",
+        description="Test",
+        severity=Severity.CRITICAL if i % 2 else Severity.LOW,
+        priority=Priority.HIGH,
+        status=Status.IN_PROGRESS if i % 2 else Status.OPEN,
+        assigned_to="john.doe",
+        created_by="jane.doe",
+        created_at=datetime(2024, 1, 1 + i, 9, 30, 0, 250),
+        updated_at=datetime(2024, 1, 1 + i, 9, 30),
+        steps_to_reproduce="Steps",
+        expected_result=None,
+        actual_result="Actual"
+    ) for i in range(5))
+    return ExportService(db_manager, batch_size=2)
+
+def test_parquet_export_round_trips_with_categorical_enums(export_service):
+    filepath = export_service.export_parquet("bugs")
+
+    frame = pq.read_table(filepath).to_pandas()
+    assert list(frame['id']) == [f"bug-{i}" for i in range(5)]
+    assert frame['status'].dtype == 'category'
+    assert list(frame['status'].cat.categories) == [status.value for status in Status]
+    assert list(frame['status'][:2]) == ["Open", "In Progress"]
+    assert frame['created_at'][0] == datetime(2024, 1, 1, 9, 30, 0, 250)
+    assert frame['expected_result'].isna().all()
+
+def test_arrow_export_applies_filters(export_service):
+    filepath = export_service.export_arrow("bugs", {'severity_filter': ["Critical"]})
+
+    table = pa_ipc.open_file(filepath).read_all()
+    assert table.column('id').to_pylist() == ["bug-1", "bug-3"]
+    assert table.column('severity').type.value_type == 'string'
+
+def test_csv_export_streams_every_batch(export_service):
+    progress = []
+    filepath = export_service.export_csv("bugs", progress=progress.append)
+
+    with open(filepath, newline='') as file:
+        rows = list(csv.DictReader(file))
+    assert progress == [2, 2, 1]
+    assert [row['severity'] for row in rows] == ["Low", "Critical", "Low", "Critical", "Low"]
+    assert rows[0]['title'] == "Bug 0"
@@ -0,0 +1,98 @@
+# tests/test_importer.py
+import pytest
+import json
+from datetime import datetime, timezone
+from src.importer import import_file, parse_bug
+from src.models.bug import Status, Severity, Priority
+
+def test_parse_bug_accepts_enum_names_and_values():
+    bug = parse_bug({
+        'title': 'Crash on save',
+        'severity': 'critical',
+        'priority': 'High',
+        'status': 'In Progress',
+        'created_at': '2024-03-01T10:00:00'
+    })
+
+    assert bug.severity == Severity.CRITICAL
+    assert bug.priority == Priority.HIGH
+    assert bug.status == Status.IN_PROGRESS
+    assert bug.updated_at == bug.created_at
+
+def test_parse_bug_converts_timestamps_with_offsets_to_local_time():
+    bug = parse_bug({
+        'title': 'Crash on save',
+        'severity': 'Low',
+        'priority': 'Low',
+        'created_at': '2024-03-01T10:00:00+05:00'
+    })
+
+    local = datetime(2024, 3, 1, 5, 0, tzinfo=timezone.utc).astimezone()
+    assert bug.created_at == local.replace(tzinfo=None)
+
+def test_import_csv_counts_rejected_rows(db_manager, tmp_path):
+    path = tmp_path / 'bugs.csv'
+    path.write_text(
+        "title,severity,priority,description\n"
+        "Crash on save,High,Low,\"multi\nline\"\n"
+        ",High,Low,missing title\n"
+        "Slow search,Urgent,Low,bad severity\n"
+        "Typo,LOW,MEDIUM,\n"
+    )
+
+    stats = import_file(str(path), db_manager, batch_size=1)
+
+    assert stats.accepted == 2
+    assert stats.rejected == 2
+    assert len(db_manager.get_all_bugs()) == 2
+
+def test_import_csv_with_byte_order_mark(db_manager, tmp_path):
+    path = tmp_path / 'bugs.csv'
+    path.write_text("title,severity,priority\nCrash on save,High,Low\n", encoding='utf-8-sig')
+
+    stats = import_file(str(path), db_manager)
+
+    assert (stats.accepted, stats.rejected) == (1, 0)
+    assert db_manager.get_all_bugs()[0].title == 'Crash on save'
+
+def test_import_jsonl_rejects_malformed_lines(db_manager, tmp_path):
+    path = tmp_path / 'bugs.jsonl'
+    path.write_text(
+        json.dumps({'title': 'One', 'severity': 'Low', 'priority': 'Low'}) + "\n"
+        "{not json\n"
+        "\n"
+        + json.dumps({'title': 'Two', 'severity': 'Medium', 'priority': 'High'}) + "\n"
+    )
+
+    stats = import_file(str(path), db_manager)
+
+    assert stats.accepted == 2
+    assert stats.rejected == 1
+    assert stats.errors[0].startswith("line 2:")
+    assert db_manager.get_bug_statistics()['total_bugs'] == 2
+
+def test_import_rejects_ids_already_taken(db_manager, tmp_path):
+    path = tmp_path / 'bugs.jsonl'
+    path.write_text(''.join(json.dumps({
+        'id': bug_id, 'title': f"Bug {bug_id}", 'severity': 'Low', 'priority': 'Low'
+    }) + "\n" for bug_id in ["a", "b", "a", "c"]))
+    import_file(str(path), db_manager, batch_size=10)
+
+    path.write_text(''.join(json.dumps({
+        'id': bug_id, 'title': f"Bug {bug_id}", 'severity': 'Low', 'priority': 'Low'
+    }) + "\n" for bug_id in ["d", "b", "e"]))
+    stats = import_file(str(path), db_manager, batch_size=10)
+
+    # The valid rows of a batch with a collision are still saved
+    assert stats.accepted == 2
+    assert stats.errors == ["line 2: duplicate id: 'b'"]
+    assert db_manager.get_bug_statistics()['total_bugs'] == 5
+
+def test_import_reports_bad_arguments_and_encoding(db_manager, tmp_path):
+    path = tmp_path / 'bugs.csv'
+    path.write_bytes(b"title,severity,priority\nCaf\xe9,Low,Low\n")
+
+    with pytest.raises(ValueError, match="--progress-every"):
+        import_file(str(path), db_manager, progress_every=0)
+    with pytest.raises(ValueError, match="not valid UTF-8"):
+        import_file(str(path), db_manager)
@@ -0,0 +1,96 @@
+# tests/test_report_job_service.py
+import pytest
+import os
+from src.models.bug import Status
+from src.services.bug_service import BugService
+from src.services.export_service import ExportService
+from src.services.report_job_service import JobStatus, REPORT_FORMATS, ReportJobService
+from src.services.report_service import ReportService
+
+@pytest.fixture
+def report_jobs(db_manager, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    bug_service = BugService(db_manager)
+    bug_service.create_bugs({
+        'title': f"Bug {i}",
+        'description': "Test",
+        'severity': 'HIGH',
+        'priority': 'HIGH',
+        'assigned_to': "john.doe",
+        'created_by': "jane.doe",
+        'steps_to_reproduce': "Steps",
+        'expected_result': "Expected",
+        'actual_result': "Actual"
+    } for i in range(3))
+    service = ReportJobService(bug_service, ReportService(),
+                               ExportService(bug_service.db_manager))
+    yield service
+    service.shutdown()
+
+def test_report_job_builds_file_and_reports_progress(report_jobs):
+    job = report_jobs.wait(report_jobs.submit('Excel', {'status_filter': ["Open"]}))
+
+    assert job.status == JobStatus.DONE
+    assert job.rows_written == job.total_rows == 3
+    assert job.progress == 1.0
+    assert os.path.exists(job.filepath)
+
+def test_identical_requests_reuse_result_until_data_changes(report_jobs):
+    first = report_jobs.wait(report_jobs.submit('PDF', {'status_filter': ["Open", "Closed"]}))
+
+    # Filter order does not matter and the finished job is returned as is
+    assert report_jobs.submit('PDF', {'status_filter': ["Closed", "Open"]}) == first.id
+    assert report_jobs.submit('Excel', {'status_filter': ["Open", "Closed"]}) != first.id
+
+    report_jobs.bug_service.transition_bugs(Status.CLOSED)
+    second = report_jobs.wait(report_jobs.submit('PDF', {'status_filter': ["Open", "Closed"]}))
+    assert second.id != first.id
+    assert second.filepath != first.filepath
+
+@pytest.mark.parametrize('report_format', ['CSV', 'Parquet', 'Arrow'])
+def test_export_jobs_report_progress(report_jobs, report_format):
+    job = report_jobs.wait(report_jobs.submit(report_format))
+
+    assert job.status == JobStatus.DONE
+    assert job.rows_written == 3
+    assert job.filepath.endswith(REPORT_FORMATS[report_format])
+
+def test_failed_job_records_error(report_jobs, monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("disk full")
+    monkeypatch.setattr(report_jobs.report_service, 'generate_excel_report', fail)
+
+    job = report_jobs.wait(report_jobs.submit('Excel'))
+
+    assert job.status == JobStatus.FAILED
+    assert job.error == "disk full"
+
+def test_old_results_are_evicted_with_their_files(report_jobs):
+    report_jobs.max_results = 1
+    first = report_jobs.wait(report_jobs.submit('Excel'))
+    report_jobs.wait(report_jobs.submit('PDF'))
+
+    assert report_jobs.get_job(first.id) is None
+    assert not os.path.exists(first.filepath)
+
+def test_finished_and_failed_jobs_do_not_accumulate(report_jobs, monkeypatch):
+    report_jobs.max_results = 2
+    def fail(*args, **kwargs):
+        raise RuntimeError("disk full")
+    monkeypatch.setattr(report_jobs.report_service, 'generate_excel_report', fail)
+
+    failed = [report_jobs.wait(report_jobs.submit('Excel')) for _ in range(5)]
+
+    assert report_jobs.get_job(failed[0].id) is None
+    assert report_jobs.get_job(failed[-1].id).error == "disk full"
+    assert len(report_jobs._jobs) == 2
+    assert report_jobs._futures == {}
+
+    # A rebuilt report replaces the job that built the missing file
+    first = report_jobs.wait(report_jobs.submit('PDF'))
+    os.remove(first.filepath)
+    second = report_jobs.wait(report_jobs.submit('PDF'))
+
+    assert second.id != first.id
+    assert report_jobs.get_job(first.id) is None
+    assert report_jobs._futures == {}
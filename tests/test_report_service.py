@@ -1,7 +1,10 @@
 # tests/test_report_service.py
 import pytest
 import os
+from dataclasses import replace
 from datetime import datetime
+from openpyxl import load_workbook
+from pypdf import PdfReader
 from src.services.report_service import ReportService
 from src.models.bug import Bug, Status, Severity, Priority
 
@@ -46,6 +49,15 @@ def test_generate_excel_report(report_service, sample_bugs, tmp_path):
     # Verify the reports directory still exists
     assert os.path.exists(report_service.reports_dir)
 
+def test_generate_excel_report_from_stream(report_service, sample_bugs):
+    filepath = report_service.generate_excel_report(iter(sample_bugs * 3), "test_stream")
+
+    sheet = load_workbook(filepath, read_only=True).active
+    rows = list(sheet.values)
+    assert rows[0][:3] == ('ID', 'Title', 'Status')
+    assert len(rows) == 4
+    assert rows[1][:5] == ("1", "Bug 1", "Open", "High", "High")
+
 def test_generate_pdf_report(report_service, sample_bugs, tmp_path):
     # Create a temporary filename
     filename = "test_report"
@@ -63,6 +75,27 @@ def test_generate_pdf_report(report_service, sample_bugs, tmp_path):
     # Verify the reports directory still exists
     assert os.path.exists(report_service.reports_dir)
 
+def test_generate_pdf_report_in_parallel_parts(report_service, sample_bugs):
+    bugs = [replace(sample_bugs[0], id=f"bug-{i}", title=f"Bug {i} \u2013 crash")
+            for i in range(5)]
+    statistics = {
+        'total_bugs': 5,
+        'status_distribution': {'Open': 5},
+        'severity_distribution': {'High': 5},
+        'priority_distribution': {'High': 5}
+    }
+
+    filepath = report_service.generate_pdf_report(
+        iter(bugs), "test_parts", statistics, rows_per_part=2, max_workers=2)
+
+    pages = PdfReader(filepath).pages
+    assert len(pages) == 3
+    text = ''.join(page.extract_text() for page in pages)
+    assert 'Total bugs: 5' in text
+    assert text.count('Bug Report') == 1
+    positions = [text.index(f"Bug {i} ? crash") for i in range(5)]
+    assert positions == sorted(positions)
+
 @pytest.fixture(autouse=True)
 def cleanup():
     # Setup: ensure reports directory exists